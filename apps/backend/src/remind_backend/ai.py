@@ -34,10 +34,15 @@ def calculate_cost(input_tokens: int, output_tokens: int) -> int:
     return max(1, total_cents)  # Minimum 1 cent per request
 
 
-async def suggest_reminder(reminder_text: str) -> AIResponse:
-    """Get AI suggestion for reminder text using Groq."""
+async def suggest_reminder(reminder_text: str, client: AsyncGroq | None = None) -> AIResponse:
+    """Get AI suggestion for reminder text using Groq.
+
+    Pass a long-lived ``client`` to reuse its connection pool across calls;
+    otherwise a new client is created for this call.
+    """
     settings = get_settings()
-    client = AsyncGroq(api_key=settings.groq_api_key)
+    if client is None:
+        client = AsyncGroq(api_key=settings.groq_api_key)
 
     prompt = build_suggestion_prompt(reminder_text)
 
@@ -99,3 +99,24 @@ async def test_suggest_reminder_invalid_response(mock_settings, mock_groq_class)
 
     with pytest.raises(ValueError, match="parse AI response"):
         await suggest_reminder("test reminder")
+
+
+@pytest.mark.asyncio
+@patch("remind_backend.ai.AsyncGroq")
+@patch("remind_backend.ai.get_settings")
+async def test_suggest_reminder_uses_given_client(mock_settings, mock_groq_class):
+    """Test a caller-supplied client is used instead of creating one."""
+    mock_settings.return_value = MagicMock(groq_api_key="gsk-test", ai_model="gpt-oss-20b")
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = '{"suggested_text": "Buy milk", "priority": "low"}'
+    mock_response.usage.prompt_tokens = 40
+    mock_response.usage.completion_tokens = 15
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    result = await suggest_reminder("buy milk", client=client)
+
+    assert result["priority"] == PriorityLevel.LOW
+    client.chat.completions.create.assert_awaited_once()
+    mock_groq_class.assert_not_called()
@@ -1,11 +1,11 @@
 """Doctor command - diagnose and fix issues."""
 
-import httpx
 import typer
 
 from remind_database import DatabaseConfig, DatabaseSession
 from remind_cli.config import load_config
 from remind_cli.services.config_service import ConfigService
+from remind_cli.utils import prefetch_dns
 from remind_cli import output
 
 
@@ -39,6 +39,9 @@ def doctor() -> None:
         checks_total += 1
         try:
             config = load_config()
+            if config.ai_backend_url:
+                # Resolve the backend host while the remaining checks run
+                prefetch_dns(config.ai_backend_url)
             output.label_value("Configuration", "[success]✓ valid[/success]")
             checks_passed += 1
         except Exception as e:
@@ -59,6 +62,8 @@ def doctor() -> None:
             checks_passed += 1  # Informational, not a failure
 
         # Check 4: Backend connectivity
+        import httpx
+
         checks_total += 1
         backend_url = config.ai_backend_url if config else None
         if backend_url:
@@ -64,7 +64,7 @@ def list_cmd(
                 }
                 for r in reminders
             ]
-            output.reminders_table(rows)
+            output.reminders_table(rows, has_done=True)
 
     except Exception as e:
         output.error(str(e))
@@ -2,7 +2,6 @@
 
 from typing import Optional
 
-import httpx
 import typer
 
 from remind_shared import AuthenticationError
@@ -15,6 +14,8 @@ def _resolve_plan_tier(token: str, backend_url: Optional[str]) -> str:
     """Query backend for actual plan tier. Falls back to token parsing."""
     if backend_url:
         try:
+            import httpx
+
             with httpx.Client(timeout=10.0) as client:
                 resp = client.get(
                     f"{backend_url.rstrip('/')}/api/v1/usage/stats",
@@ -10,12 +10,16 @@ from remind_cli import output
 def search(
     query: str = typer.Argument(..., help="Search query"),
     json_output: bool = typer.Option(False, "--json", "-j", help="JSON output"),
+    prefix: bool = typer.Option(
+        False, "--prefix", help="Only match reminders whose text starts with the query"
+    ),
 ) -> None:
     """Search reminders by text.
 
     Examples:
       remind search grocery
       remind search 'buy groceries' --json
+      remind search proj --prefix    # texts starting with "proj"
     """
     try:
         db_config = DatabaseConfig()
@@ -23,7 +27,7 @@ def search(
 
         with db_session.get_session() as session:
             reminder_service = ReminderService(session)
-            reminders = reminder_service.search_reminders(query)
+            reminders = reminder_service.search_reminders(query, prefix=prefix)
 
         if not reminders:
             output.info(f"No reminders matching '{query}'")
@@ -50,7 +54,7 @@ def search(
                 }
                 for r in reminders
             ]
-            output.reminders_table(rows)
+            output.reminders_table(rows, has_done=False)
 
     except Exception as e:
         output.error(str(e))
@@ -8,6 +8,8 @@ from remind_cli.config import load_config
 from remind_cli.services.config_service import ConfigService
 from remind_cli import output
 
+_BOOLS = {"true": True, "false": False}
+
 
 def _get_plan_display(config_service: ConfigService) -> str:
     """Get plan tier from stored config, not token string."""
@@ -44,9 +46,10 @@ def settings(
 
             key, value = set_key.split("=", 1)
 
-            if value.lower() in ("true", "false"):
-                parsed_value = value.lower() == "true"
-            elif value.isdigit():
+            v_lower = value.lower()
+            if v_lower in _BOOLS:
+                parsed_value = _BOOLS[v_lower]
+            elif value.removeprefix("-").isdigit():
                 parsed_value = int(value)
             else:
                 parsed_value = value
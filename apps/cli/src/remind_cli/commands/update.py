@@ -1,23 +1,43 @@
 """Update command - update the CLI to the latest version."""
 
+import functools
 import os
 import shutil
 import subprocess
 import sys
+from pathlib import Path
 
 import typer
 
 from remind_cli import __version__, output
 from remind_cli.platform_utils import get_platform
 
+# PATH lookups are stable for the life of the process
+_which = functools.lru_cache(maxsize=16)(shutil.which)
+
+_SYSTEMD_UNIT = "remind-scheduler.service"
+_PLIST_PATH = Path.home() / "Library" / "LaunchAgents" / "com.remind.scheduler.plist"
+
+
+@functools.lru_cache(maxsize=64)
+def _exists(path: str) -> bool:
+    """Cached existence check for paths probed during detection."""
+    return os.path.exists(path)
+
+
+def _in_git_work_tree() -> bool:
+    """Check whether the current directory is inside a git checkout."""
+    cwd = Path.cwd()
+    return any(_exists(str(d / ".git")) for d in (cwd, *cwd.parents))
+
 
 def _detect_install_method() -> str:
     """Detect how remind was installed.
 
     Returns one of: 'pip', 'brew', 'binary', 'source'
     """
-    # Check brew first
-    if shutil.which("brew"):
+    # Check brew first (Homebrew only exists on macOS and Linux)
+    if sys.platform in ("darwin", "linux") and _which("brew"):
         try:
             result = subprocess.run(
                 ["brew", "list", "remind"],
@@ -28,28 +48,23 @@ def _detect_install_method() -> str:
         except Exception:
             pass
 
-    # Check if running from a uv tool install (uvx)
-    remind_bin = shutil.which("remind")
-    if remind_bin:
-        resolved = os.path.realpath(remind_bin)
+    remind_bin = _which("remind")
+    resolved = os.path.realpath(remind_bin) if remind_bin else None
+
+    if resolved:
+        # Check if running from a uv tool install (uvx)
         if "/uv/tools/" in resolved or "/.local/share/uv/" in resolved:
             return "uv"
 
-    # Check if running from a pip installed package
-    if remind_bin:
-        resolved = os.path.realpath(remind_bin)
+        # Check if running from a pip installed package
         if "site-packages" in resolved or "/.venv/" in resolved or "/venv/" in resolved:
             return "pip"
 
     # Check if we're in a git repo (development/source install)
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            capture_output=True, timeout=3,
-        )
-        if result.returncode == 0:
+        if _in_git_work_tree():
             return "source"
-    except Exception:
+    except OSError:
         pass
 
     # Standalone binary (no pip, no brew, no git)
@@ -65,21 +80,25 @@ def _restart_scheduler() -> None:
         platform = get_platform()
         if platform.is_linux:
             result = subprocess.run(
-                ["systemctl", "--user", "is-active", "remind-scheduler.service"],
+                ["systemctl", "--user", "is-active", _SYSTEMD_UNIT],
                 capture_output=True, timeout=5,
             )
             if result.returncode == 0:
                 subprocess.run(
-                    ["systemctl", "--user", "restart", "remind-scheduler.service"],
+                    ["systemctl", "--user", "restart", _SYSTEMD_UNIT],
                     capture_output=True, timeout=10,
                 )
                 output.success("Scheduler restarted.")
         elif platform.is_macos:
-            from pathlib import Path
-            plist = Path.home() / "Library" / "LaunchAgents" / "com.remind.scheduler.plist"
-            if plist.exists():
-                subprocess.run(["launchctl", "unload", str(plist)], capture_output=True, timeout=5)
-                subprocess.run(["launchctl", "load", str(plist)], capture_output=True, timeout=5)
+            if _exists(str(_PLIST_PATH)):
+                plist = str(_PLIST_PATH)
+                domain = f"gui/{os.getuid()}"
+                subprocess.run(
+                    ["launchctl", "bootout", domain, plist], capture_output=True, timeout=5
+                )
+                subprocess.run(
+                    ["launchctl", "bootstrap", domain, plist], capture_output=True, timeout=5
+                )
                 output.success("Scheduler restarted.")
     except Exception:
         pass  # Non-critical
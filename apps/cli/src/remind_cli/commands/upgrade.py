@@ -17,6 +17,12 @@ PLANS = {
     "team": {"price": "$50/mo", "limit": "5,000+ AI suggestions"},
 }
 
+# Pre-rendered plan rows (everything but the choice number)
+_PLAN_ROWS = {
+    plan: f"{plan.upper():<6}  {info['price']:<8}  {info['limit']}"
+    for plan, info in PLANS.items()
+}
+
 
 def _get_current_tier(config_service: ConfigService) -> str:
     """Get current plan tier."""
@@ -66,12 +72,12 @@ def upgrade() -> None:
         output.console.print("  Available upgrades:")
         output.blank()
 
-        for i, plan in enumerate(available, 1):
-            info = PLANS[plan]
-            label = plan.upper().ljust(6)
-            output.console.print(
-                f"  [label]{i}[/label]  {label}  {info['price'].ljust(8)}  {info['limit']}"
+        output.console.print(
+            "\n".join(
+                f"  [label]{i}[/label]  {_PLAN_ROWS[plan]}"
+                for i, plan in enumerate(available, 1)
             )
+        )
 
         output.blank()
         output.dot_rule()
@@ -82,7 +88,15 @@ def upgrade() -> None:
             output.blank()
             return
 
-        choice = typer.prompt(f"Enter plan number (1-{len(available)}) or 0 to cancel", type=int)
+        try:
+            choice = int(input(f"Enter plan number (1-{len(available)}) or 0 to cancel: ").strip())
+        except ValueError:
+            output.error("Invalid number")
+            raise typer.Exit(1)
+        except (EOFError, KeyboardInterrupt):
+            # Closed stdin or Ctrl-D/Ctrl-C: abort like typer.prompt did
+            output.blank()
+            raise typer.Exit(1)
 
         if choice == 0:
             output.blank()
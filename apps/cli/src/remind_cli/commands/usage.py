@@ -1,10 +1,10 @@
 """Usage command - show real usage statistics from backend."""
 
-import httpx
 import typer
 
 from remind_cli.config import load_config
 from remind_cli.services.config_service import ConfigService
+from remind_cli.utils import prefetch_dns
 from remind_cli import output
 
 
@@ -29,6 +29,10 @@ def usage() -> None:
             output.error("No backend URL configured.")
             raise typer.Exit(1)
 
+        # Resolve the backend host while httpx loads
+        prefetch_dns(backend_url)
+        import httpx
+
         # Fetch real usage from backend
         try:
             with httpx.Client(timeout=10.0) as client:
@@ -1,15 +1,21 @@
 """MCP server for Remind CLI — exposes reminder tools to Claude Code and other MCP clients."""
 
+import asyncio
+import functools
 import os
-from datetime import datetime, timedelta, timezone
+import re
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from functools import lru_cache
 
 from dateparser import parse as dateparser_parse
 from fastmcp import FastMCP
 
 from remind_database import DatabaseConfig, DatabaseSession
-from remind_shared import PriorityLevel
+from remind_shared import Config, PriorityLevel, Reminder
 from remind_cli.services.reminder_service import ReminderService
-from remind_cli.config import load_config, save_config
+from remind_cli.config import get_config_path, load_config, save_config
 
 mcp = FastMCP("Remind")
 
@@ -22,7 +28,101 @@ def _get_db_session() -> DatabaseSession:
     return _db_session
 
 
+def _in_thread(func: Callable[..., str]) -> Callable[..., Awaitable[str]]:
+    """Expose a blocking tool as async, running it in a worker thread.
+
+    Keeps database and file I/O off the event loop so concurrent MCP
+    requests don't serialize behind each other.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> str:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _format_reminder(r: Reminder, status: str = "", show_project: bool = False) -> str:
+    """Render a single reminder as one line of tool output."""
+    project_tag = f" ({r.project_context})" if show_project and r.project_context else ""
+    return f"#{r.id} [{_PRIORITY_LABELS[r.priority]}] {r.text}{project_tag} — due: {r.due_at}{status}"
+
+
+_PRIORITIES = {p.value: p for p in PriorityLevel}
+_PRIORITY_LABELS = {p: p.value.upper() for p in PriorityLevel}
+
+_CONFIG_FIELD_TYPES = {name: field.annotation for name, field in Config.model_fields.items()}
+
+_DURATION_RE = re.compile(r"^\s*(\d+)\s*(minute|hour|day|week)s?\s*$", re.IGNORECASE)
+_DURATION_SECONDS = {"minute": 60, "hour": 3600, "day": 86400, "week": 604800}
+
+_MSG_NO_REMINDERS = "No reminders found."
+_MSG_NO_OVERDUE = "No overdue reminders."
+_MSG_BAD_DURATION = (
+    "Duration format: '<number> <unit>' (e.g., '2 hours', '1 day'). Units: minute, hour, day, week"
+)
+_MSG_BAD_IDS = "Invalid format. Use comma-separated IDs: '1,5,12'"
+_FMT_INVALID_PRIORITY = "Invalid priority: {}. Use: high, medium, low".format
+_FMT_BAD_DUE = "Could not parse due date: {}".format
+_FMT_ERROR = "Error: {}".format
+
+_AGENT_MSG_TEMPLATE = (
+    "Agent reminder #{id} scheduled.\n"
+    "Task: {task}\n"
+    "When: {when}\n"
+    "Directory: {cwd}\n"
+    "\n"
+    "WARNING: At the scheduled time, this will execute:\n"
+    '  claude -p "{task}" --dangerously-skip-permissions\n'
+    "  (in {cwd})\n"
+    "\n"
+    "Claude will have full permissions to read, write, and execute in this directory."
+)
+
+_DP_LANGUAGES = ["en"]
+_DP_SETTINGS = {"PREFER_DATES_FROM": "future"}
+_DATE_HINTS = (
+    "today", "tonight", "tomorrow", "next", "in ", "at ", "am", "pm",
+    "noon", "midnight", "minute", "hour", "day", "week", "month",
+)
+
+
+@lru_cache(maxsize=2048)
+def _cached_parse(text: str, bucket: int, prefer_future: bool = False) -> datetime | None:
+    """Parse a date string with dateparser, memoized per minute bucket."""
+    # ISO timestamps don't need dateparser at all
+    try:
+        return datetime.fromisoformat(text.strip())
+    except ValueError:
+        pass
+
+    settings = _DP_SETTINGS if prefer_future else None
+    return dateparser_parse(text, languages=_DP_LANGUAGES, settings=settings)
+
+
+def _parse_date(text: str, prefer_future: bool = False) -> datetime | None:
+    """Parse natural language dates, reusing results from the current minute."""
+    if not text.strip():
+        return None  # dateparser takes seconds to reject empty input
+    return _cached_parse(text, int(time.time() // 60), prefer_future)
+
+
+@lru_cache(maxsize=128)
+def _project_name(cwd: str) -> str:
+    """Return the directory name used to tag agent reminders."""
+    return os.path.basename(cwd)
+
+
+def _looks_like_date(text: str) -> bool:
+    """Cheap pre-filter so free-form reminder text skips dateparser."""
+    if len(text) <= 64 and any(c.isdigit() for c in text):
+        return True
+    lowered = text.lower()
+    return any(hint in lowered for hint in _DATE_HINTS)
+
+
 @mcp.tool
+@_in_thread
 def add_reminder(
     text: str,
     due: str | None = None,
@@ -41,20 +141,19 @@ def add_reminder(
     Returns:
         Confirmation message with reminder details.
     """
-    try:
-        priority_level = PriorityLevel(priority.lower())
-    except ValueError:
-        return f"Invalid priority: {priority}. Use: high, medium, low"
+    priority_level = _PRIORITIES.get(priority.lower())
+    if priority_level is None:
+        return _FMT_INVALID_PRIORITY(priority)
 
     # Parse due date
     due_dt = None
     if due:
-        due_dt = dateparser_parse(due)
+        due_dt = _parse_date(due)
         if not due_dt:
-            return f"Could not parse due date: {due}"
+            return _FMT_BAD_DUE(due)
 
-    if due_dt is None:
-        due_dt = dateparser_parse(text, settings={"PREFER_DATES_FROM": "future"})
+    if due_dt is None and _looks_like_date(text):
+        due_dt = _parse_date(text, prefer_future=True)
     if due_dt is None:
         due_dt = datetime.now()
 
@@ -79,11 +178,14 @@ def add_reminder(
 
 
 @mcp.tool
-def list_reminders(include_done: bool = False) -> str:
+@_in_thread
+def list_reminders(include_done: bool = False, limit: int = 100, offset: int = 0) -> str:
     """List all reminders. Shows active (not completed) reminders by default.
 
     Args:
         include_done: If True, also show completed reminders. Defaults to False.
+        limit: Maximum number of reminders to return. Defaults to 100.
+        offset: Number of reminders to skip, for paging through results.
 
     Returns:
         Formatted list of reminders with ID, text, due date, priority, and status.
@@ -91,31 +193,27 @@ def list_reminders(include_done: bool = False) -> str:
     db_session = _get_db_session()
     with db_session.get_session() as session:
         service = ReminderService(session)
-        reminders = service.list_all_reminders() if include_done else service.list_active_reminders()
+        reminders, total = service.list_reminders_page(include_done, limit, offset)
 
     if not reminders:
-        return "No reminders found."
-
-    lines = []
-    now = datetime.now(timezone.utc)
-    for r in reminders:
-        status = ""
-        if r.done_at:
-            status = " [DONE]"
-        else:
-            due_utc = r.due_at.replace(tzinfo=timezone.utc) if r.due_at.tzinfo is None else r.due_at
-            if due_utc < now:
-                status = " [OVERDUE]"
+        return _MSG_NO_REMINDERS
 
-        project_tag = f" ({r.project_context})" if r.project_context else ""
-        lines.append(
-            f"#{r.id} [{r.priority.value.upper()}] {r.text}{project_tag} — due: {r.due_at}{status}"
+    body = "\n".join(
+        _format_reminder(
+            r,
+            " [DONE]" if r.done_at else " [OVERDUE]" if overdue else "",
+            show_project=True,
         )
-
-    return "\n".join(lines)
+        for r, overdue in reminders
+    )
+    remaining = total - offset - len(reminders)
+    if remaining > 0:
+        body += f"\n… +{remaining} more (use offset={offset + len(reminders)})"
+    return body
 
 
 @mcp.tool
+@_in_thread
 def complete_reminder(reminder_id: int) -> str:
     """Mark a reminder as done/completed.
 
@@ -132,15 +230,19 @@ def complete_reminder(reminder_id: int) -> str:
             reminder = service.mark_reminder_done(reminder_id)
         return f"Completed: #{reminder.id} — {reminder.text}"
     except Exception as e:
-        return f"Error: {e}"
+        return _FMT_ERROR(e)
 
 
 @mcp.tool
-def search_reminders(query: str) -> str:
+@_in_thread
+def search_reminders(query: str, limit: int = 200, offset: int = 0, prefix: bool = False) -> str:
     """Search reminders by text content.
 
     Args:
         query: Search term to find in reminder text (case-insensitive).
+        limit: Maximum number of matches to return (default 200).
+        offset: Number of matches to skip, for paging through results.
+        prefix: Only match reminders whose text starts with the query.
 
     Returns:
         Matching reminders or a message if none found.
@@ -148,20 +250,22 @@ def search_reminders(query: str) -> str:
     db_session = _get_db_session()
     with db_session.get_session() as session:
         service = ReminderService(session)
-        results = service.search_reminders(query)
+        # One extra row tells us whether another page exists
+        results = service.search_reminders(query, limit=limit + 1, offset=offset, prefix=prefix)
 
     if not results:
         return f"No reminders matching '{query}'."
 
-    lines = []
-    for r in results:
-        status = " [DONE]" if r.done_at else ""
-        lines.append(f"#{r.id} [{r.priority.value.upper()}] {r.text} — due: {r.due_at}{status}")
-
-    return "\n".join(lines)
+    has_more = len(results) > limit
+    results = results[:limit]
+    body = "\n".join(_format_reminder(r, " [DONE]" if r.done_at else "") for r in results)
+    if has_more:
+        body += f"\n(showing {limit} matches; use offset={offset + limit} for more)"
+    return body
 
 
 @mcp.tool
+@_in_thread
 def update_reminder(
     reminder_id: int,
     text: str | None = None,
@@ -185,16 +289,15 @@ def update_reminder(
     """
     priority_level = None
     if priority:
-        try:
-            priority_level = PriorityLevel(priority.lower())
-        except ValueError:
-            return f"Invalid priority: {priority}. Use: high, medium, low"
+        priority_level = _PRIORITIES.get(priority.lower())
+        if priority_level is None:
+            return _FMT_INVALID_PRIORITY(priority)
 
     due_dt = None
     if due:
-        due_dt = dateparser_parse(due)
+        due_dt = _parse_date(due)
         if not due_dt:
-            return f"Could not parse due date: {due}"
+            return _FMT_BAD_DUE(due)
 
     db_session = _get_db_session()
     try:
@@ -214,10 +317,11 @@ def update_reminder(
             f"Priority: {reminder.priority.value}"
         )
     except Exception as e:
-        return f"Error: {e}"
+        return _FMT_ERROR(e)
 
 
 @mcp.tool
+@_in_thread
 def delete_reminder(reminder_id: int) -> str:
     """Permanently delete a reminder.
 
@@ -236,10 +340,11 @@ def delete_reminder(reminder_id: int) -> str:
             return f"Deleted reminder #{reminder_id}."
         return f"Reminder #{reminder_id} not found."
     except Exception as e:
-        return f"Error: {e}"
+        return _FMT_ERROR(e)
 
 
 @mcp.tool
+@_in_thread
 def agent_reminder(
     task: str,
     due: str,
@@ -262,9 +367,9 @@ def agent_reminder(
     Returns:
         Confirmation with details about the scheduled agent task.
     """
-    due_dt = dateparser_parse(due)
+    due_dt = _parse_date(due)
     if not due_dt:
-        return f"Could not parse due date: {due}"
+        return _FMT_BAD_DUE(due)
 
     cwd = project_path or os.getcwd()
 
@@ -279,26 +384,18 @@ def agent_reminder(
                 text=agent_text,
                 due_at=due_dt,
                 priority=PriorityLevel.HIGH,
-                project_context=f"agent:{os.path.basename(cwd)}",
+                project_context=f"agent:{_project_name(cwd)}",
             )
 
-        return (
-            f"Agent reminder #{reminder.id} scheduled.\n"
-            f"Task: {task}\n"
-            f"When: {reminder.due_at}\n"
-            f"Directory: {cwd}\n"
-            f"\n"
-            f"WARNING: At the scheduled time, this will execute:\n"
-            f"  claude -p \"{task}\" --dangerously-skip-permissions\n"
-            f"  (in {cwd})\n"
-            f"\n"
-            f"Claude will have full permissions to read, write, and execute in this directory."
+        return _AGENT_MSG_TEMPLATE.format_map(
+            {"id": reminder.id, "task": task, "when": reminder.due_at, "cwd": cwd}
         )
     except Exception as e:
         return f"Error creating agent reminder: {e}"
 
 
 @mcp.tool
+@_in_thread
 def get_context() -> str:
     """Get reminders filtered by project context (auto-detected from current directory).
 
@@ -311,27 +408,20 @@ def get_context() -> str:
     db_session = _get_db_session()
     with db_session.get_session() as session:
         service = ReminderService(session)
-        reminders = service.get_project_reminders(project_name)
+        reminders = service.list_reminders_with_status(project=project_name)
 
     if not reminders:
         return f"No reminders found for project '{project_name}'."
 
-    lines = [f"Project reminders for '{project_name}':"]
-    now = datetime.now(timezone.utc)
-    for r in reminders:
-        status = ""
-        if r.done_at:
-            status = " [DONE]"
-        else:
-            due_utc = r.due_at.replace(tzinfo=timezone.utc) if r.due_at.tzinfo is None else r.due_at
-            if due_utc < now:
-                status = " [OVERDUE]"
-        lines.append(f"#{r.id} [{r.priority.value.upper()}] {r.text} — {r.due_at}{status}")
-
-    return "\n".join(lines)
+    body = "\n".join(
+        f"#{r.id} [{_PRIORITY_LABELS[r.priority]}] {r.text} — {r.due_at}{' [OVERDUE]' if overdue else ''}"
+        for r, overdue in reminders
+    )
+    return f"Project reminders for '{project_name}':\n{body}"
 
 
 @mcp.tool
+@_in_thread
 def get_overdue() -> str:
     """Get all overdue reminders (not completed).
 
@@ -343,17 +433,20 @@ def get_overdue() -> str:
         service = ReminderService(session)
         overdue = service.get_overdue_reminders()
 
-    if not overdue:
-        return "No overdue reminders."
+    return _render_overdue(overdue)
 
-    lines = [f"You have {len(overdue)} overdue reminder(s):"]
-    for r in overdue:
-        lines.append(f"#{r.id} [{r.priority.value.upper()}] {r.text} — due: {r.due_at}")
 
-    return "\n".join(lines)
+def _render_overdue(overdue: list[Reminder]) -> str:
+    """Render the overdue reminders listing."""
+    if not overdue:
+        return _MSG_NO_OVERDUE
+
+    body = "\n".join(_format_reminder(r) for r in overdue)
+    return f"You have {len(overdue)} overdue reminder(s):\n{body}"
 
 
 @mcp.tool
+@_in_thread
 def get_upcoming(hours: int = 24) -> str:
     """Get reminders due within the next N hours.
 
@@ -368,17 +461,20 @@ def get_upcoming(hours: int = 24) -> str:
         service = ReminderService(session)
         upcoming = service.get_upcoming_reminders(hours)
 
+    return _render_upcoming(upcoming, hours)
+
+
+def _render_upcoming(upcoming: list[Reminder], hours: int) -> str:
+    """Render the upcoming reminders listing."""
     if not upcoming:
         return f"No reminders due in the next {hours} hours."
 
-    lines = [f"Reminders due in the next {hours} hours:"]
-    for r in upcoming:
-        lines.append(f"#{r.id} [{r.priority.value.upper()}] {r.text} — due: {r.due_at}")
-
-    return "\n".join(lines)
+    body = "\n".join(_format_reminder(r) for r in upcoming)
+    return f"Reminders due in the next {hours} hours:\n{body}"
 
 
 @mcp.tool
+@_in_thread
 def snooze_reminder(reminder_id: int, duration: str) -> str:
     """Snooze a reminder by a relative duration from now.
 
@@ -389,41 +485,25 @@ def snooze_reminder(reminder_id: int, duration: str) -> str:
     Returns:
         Confirmation with updated due date.
     """
-    # Simple duration parsing
-    duration_map = {
-        "minute": 60,
-        "hour": 3600,
-        "day": 86400,
-        "week": 604800,
-    }
+    match = _DURATION_RE.match(duration)
+    if not match:
+        return _MSG_BAD_DURATION
 
     try:
-        parts = duration.lower().split()
-        if len(parts) != 2:
-            return "Duration format: '<number> <unit>' (e.g., '2 hours', '1 day')"
-
-        amount = int(parts[0])
-        unit = parts[1].rstrip("s")  # Remove trailing 's' from plural
-
-        if unit not in duration_map:
-            return f"Unknown unit: {unit}. Use: minute, hour, day, or week"
-
-        seconds = amount * duration_map[unit]
-        td = timedelta(seconds=seconds)
+        seconds = int(match.group(1)) * _DURATION_SECONDS[match.group(2).lower()]
 
         db_session = _get_db_session()
         with db_session.get_session() as session:
             service = ReminderService(session)
-            reminder = service.snooze_reminder(reminder_id, td)
+            reminder = service.snooze_reminder_seconds(reminder_id, seconds)
 
         return f"Snoozed reminder #{reminder.id} until {reminder.due_at}"
-    except ValueError:
-        return "Invalid duration format. Use: '<number> <unit>' (e.g., '2 hours')"
     except Exception as e:
-        return f"Error: {e}"
+        return _FMT_ERROR(e)
 
 
 @mcp.tool
+@_in_thread
 def bulk_complete(reminder_ids: str) -> str:
     """Complete multiple reminders at once.
 
@@ -443,21 +523,43 @@ def bulk_complete(reminder_ids: str) -> str:
         if not completed:
             return f"No reminders found to complete for IDs: {reminder_ids}"
 
-        lines = [f"Completed {len(completed)} reminder(s):"]
-        for r in completed:
-            lines.append(f"#{r.id} — {r.text}")
-
-        return "\n".join(lines)
+        body = "\n".join(f"#{r.id} — {r.text}" for r in completed)
+        return f"Completed {len(completed)} reminder(s):\n{body}"
     except ValueError:
-        return "Invalid format. Use comma-separated IDs: '1,5,12'"
+        return _MSG_BAD_IDS
     except Exception as e:
-        return f"Error: {e}"
+        return _FMT_ERROR(e)
+
+
+_SUMMARY_HEADERS = {
+    "ascii": (
+        "Reminder Summary\n"
+        "------------------\n"
+        "\n"
+        "Total active: {total_active}\n"
+        "[OVERDUE] Overdue: {overdue_count}\n"
+        "[TODAY] Due today: {due_today_count}\n"
+        "[WEEK] Due this week: {due_this_week_count}\n"
+    ),
+    "emoji": (
+        "📋 Reminder Summary\n"
+        "━━━━━━━━━━━━━━━━━━\n"
+        "\n"
+        "Total active: {total_active}\n"
+        "🔴 Overdue: {overdue_count}\n"
+        "📅 Due today: {due_today_count}\n"
+        "📆 Due this week: {due_this_week_count}\n"
+    ),
+}
 
 
 @mcp.tool
+@_in_thread
 def get_summary() -> str:
     """Get a structured summary of all reminders.
 
+    The header uses emoji markers unless the 'summary_style' setting is 'ascii'.
+
     Returns:
         Summary with overdue count, due today, due this week, by priority and project.
     """
@@ -466,32 +568,76 @@ def get_summary() -> str:
         service = ReminderService(session)
         summary = service.get_summary()
 
-    lines = [
-        f"📋 Reminder Summary",
-        f"━━━━━━━━━━━━━━━━━━",
-        f"",
-        f"Total active: {summary['total_active']}",
-        f"🔴 Overdue: {summary['overdue_count']}",
-        f"📅 Due today: {summary['due_today_count']}",
-        f"📆 Due this week: {summary['due_this_week_count']}",
-        f"",
-    ]
+    return _render_summary(summary)
+
+
+# (config file mtime_ns, summary_style) of the last read, see _summary_style
+_summary_style_cache: tuple[int, str] | None = None
+
+
+def _summary_style() -> str:
+    """The 'summary_style' setting, re-read only when the config file changes."""
+    global _summary_style_cache
+    try:
+        mtime = get_config_path().stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    if _summary_style_cache is None or _summary_style_cache[0] != mtime:
+        _summary_style_cache = (mtime, load_config().summary_style)
+    return _summary_style_cache[1]
+
+
+def _render_summary(summary: dict) -> str:
+    """Render the summary block for get_summary and get_dashboard."""
+    header = _SUMMARY_HEADERS.get(_summary_style(), _SUMMARY_HEADERS["emoji"])
+    parts = [header.format_map(summary)]
 
     if summary["by_priority"]:
-        lines.append("By Priority:")
-        for priority, count in sorted(summary["by_priority"].items()):
-            lines.append(f"  {priority.upper()}: {count}")
-        lines.append("")
+        rows = "\n".join(
+            f"  {priority.upper()}: {count}"
+            for priority, count in sorted(summary["by_priority"].items())
+        )
+        parts.append(f"By Priority:\n{rows}\n")
 
     if summary["by_project"]:
-        lines.append("By Project:")
-        for project, count in sorted(summary["by_project"].items()):
-            lines.append(f"  {project}: {count}")
+        rows = "\n".join(
+            f"  {project}: {count}" for project, count in sorted(summary["by_project"].items())
+        )
+        parts.append(f"By Project:\n{rows}")
+
+    return "\n".join(parts)
+
+
+@mcp.tool
+@_in_thread
+def get_dashboard(hours: int = 24) -> str:
+    """Get overdue reminders, upcoming reminders, and the summary in one call.
 
-    return "\n".join(lines)
+    Equivalent to get_overdue + get_upcoming + get_summary, but served by a
+    single database query.
+
+    Args:
+        hours: How many hours ahead to look for upcoming reminders (default 24).
+
+    Returns:
+        The three reports separated by blank lines.
+    """
+    db_session = _get_db_session()
+    with db_session.get_session() as session:
+        service = ReminderService(session)
+        snapshot = service.dashboard_snapshot(hours)
+
+    return "\n\n".join(
+        (
+            _render_overdue(snapshot["overdue"]),
+            _render_upcoming(snapshot["upcoming"], hours),
+            _render_summary(snapshot),
+        )
+    )
 
 
 @mcp.tool
+@_in_thread
 def get_config(key: str | None = None) -> str:
     """Get configuration settings.
 
@@ -505,22 +651,20 @@ def get_config(key: str | None = None) -> str:
     try:
         config = load_config()
         if key:
-            value = getattr(config, key, None)
+            value = getattr(config, key, None) if key in _CONFIG_FIELD_TYPES else None
             if value is None:
                 return f"Setting '{key}' not found."
             return f"{key}: {value}"
 
         # Return all settings
-        lines = ["Current Configuration:"]
-        for field in config.model_fields:
-            value = getattr(config, field)
-            lines.append(f"  {field}: {value}")
-        return "\n".join(lines)
+        body = "\n".join(f"  {field}: {value}" for field, value in config.model_dump().items())
+        return f"Current Configuration:\n{body}"
     except Exception as e:
         return f"Error reading config: {e}"
 
 
 @mcp.tool
+@_in_thread
 def set_config(key: str, value: str) -> str:
     """Set a configuration setting.
 
@@ -532,28 +676,35 @@ def set_config(key: str, value: str) -> str:
         Confirmation of updated setting.
     """
     try:
-        config = load_config()
-
         # Parse value based on field type
-        field = config.model_fields.get(key)
-        if not field:
+        if key not in _CONFIG_FIELD_TYPES:
             return f"Unknown setting: {key}"
 
-        field_type = field.annotation
-        if field_type is bool or str(field_type) == "<class 'bool'>":
+        field_type = _CONFIG_FIELD_TYPES[key]
+        if field_type is bool:
             parsed_value = value.lower() in ("true", "1", "yes", "on")
-        elif field_type is int or str(field_type) == "<class 'int'>":
+        elif field_type is int:
             parsed_value = int(value)
         else:
             parsed_value = value
 
+        config = load_config()
         setattr(config, key, parsed_value)
         save_config(config)
         return f"Updated {key} to {parsed_value}"
     except Exception as e:
-        return f"Error: {e}"
+        return _FMT_ERROR(e)
+
+
+def _warm_up_dateparser() -> None:
+    """Load dateparser's English locale data before the first tool call."""
+    try:
+        dateparser_parse("tomorrow 9am", languages=_DP_LANGUAGES, settings=_DP_SETTINGS)
+    except Exception:
+        pass  # Warm-up only
 
 
 def run_mcp_server() -> None:
     """Entry point for the MCP server."""
+    _warm_up_dateparser()
     mcp.run()
@@ -1,11 +1,17 @@
 """Notification system for Remind."""
 
-import io
+import array
 import math
+import os
+import queue
+import shutil
 import struct
 import subprocess
-import wave
+import sys
+import threading
+import time
 from collections.abc import Callable
+from functools import lru_cache
 
 from remind_cli.platform_utils import get_platform
 
@@ -14,6 +20,47 @@ try:
 except ImportError:
     Notify = None  # type: ignore
 
+try:
+    import dbus
+    from dbus.exceptions import DBusException
+except ImportError:
+    dbus = None  # type: ignore
+    DBusException = Exception  # type: ignore
+
+
+_SAMPLE_RATE = 44100
+
+# Identical notifications within this window collapse into one
+_DEBOUNCE_SECONDS = 0.5
+
+# Longest a single player may run before the next one is tried
+_SOUND_TIMEOUT_SECONDS = 5
+
+
+# "fmt " chunk for 16-bit mono PCM: size, format, channels, rate, byte rate, block align, bits
+_WAV_FMT = b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, _SAMPLE_RATE, _SAMPLE_RATE * 2, 2, 16)
+
+
+def _wrap_wav(frames: bytes) -> bytes:
+    """Wrap 16-bit little-endian mono PCM frames in a WAV container."""
+    size = len(frames)
+    return b"".join((
+        b"RIFF", struct.pack("<I", 36 + size), b"WAVE", _WAV_FMT,
+        b"data", struct.pack("<I", size), frames,
+    ))
+
+
+@lru_cache(maxsize=8)
+def _fade_envelope(num_samples: int) -> tuple[float, ...]:
+    """Per-sample gain fading a tone in/out over its first and last 10ms."""
+    fade_samples = int(_SAMPLE_RATE * 0.01)
+    gains = [1.0] * num_samples
+    for i in range(min(fade_samples, num_samples)):
+        gains[i] = i / fade_samples
+    for i in range(max(num_samples - fade_samples + 1, 0), num_samples):
+        gains[i] = (num_samples - i) / fade_samples
+    return tuple(gains)
+
 
 def _generate_wav(frequency: float, duration_ms: int, volume: float = 0.5) -> bytes:
     """Generate a WAV tone in memory.
@@ -23,27 +70,91 @@ def _generate_wav(frequency: float, duration_ms: int, volume: float = 0.5) -> by
         duration_ms: Duration in milliseconds
         volume: Volume from 0.0 to 1.0
     """
-    sample_rate = 44100
+    sample_rate = _SAMPLE_RATE
     num_samples = int(sample_rate * duration_ms / 1000)
-    samples = []
+    if frequency == 0 or volume == 0:
+        return _wrap_wav(bytes(2 * num_samples))
+
+    step = 2 * math.pi * frequency / sample_rate
+    amplitude = volume * 32767
+    # The envelope depends only on the length, so it's shared across tones
+    envelope = _fade_envelope(num_samples)
+
+    # Samples go straight into an int16 buffer, no intermediate list
+    pcm = bytearray(2 * num_samples)
+    frames = memoryview(pcm).cast("h")
+
+    # sin((k+1)θ) = 2cos(θ)·sin(kθ) - sin((k-1)θ): one multiply per sample, no math.sin
+    c2 = 2 * math.cos(step)
+    prev, cur = -amplitude * math.sin(step), 0.0
     for i in range(num_samples):
-        fade_samples = int(sample_rate * 0.01)
-        if i < fade_samples:
-            envelope = i / fade_samples
-        elif i > num_samples - fade_samples:
-            envelope = (num_samples - i) / fade_samples
-        else:
-            envelope = 1.0
-        value = volume * envelope * math.sin(2 * math.pi * frequency * i / sample_rate)
-        samples.append(int(value * 32767))
+        frames[i] = int(cur * envelope[i])
+        prev, cur = cur, c2 * cur - prev
+    frames.release()
+
+    if sys.byteorder != "little":
+        swapped = array.array("h", pcm)
+        swapped.byteswap()  # WAV is little-endian
+        pcm = swapped.tobytes()
+    return _wrap_wav(bytes(pcm))
+
 
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        wf.writeframes(struct.pack(f"<{len(samples)}h", *samples))
-    return buf.getvalue()
+# (frequency Hz, duration ms, volume) per urgency
+_TONES = {
+    "critical": (880, 300, 0.7),
+    "normal": (660, 300, 0.5),
+    "low": (440, 200, 0.3),
+}
+
+# Tones are constants, so synthesize them once when the module loads
+try:
+    _WAV: dict[str, bytes] = {k: _generate_wav(*tone) for k, tone in _TONES.items()}
+except Exception:
+    _WAV = {}
+
+# Per-urgency lookups for the platform backends
+_MACOS_ALERT_SOUNDS = {"critical": "Glass", "normal": "Ping", "low": "Pop"}
+_MACOS_NOTIFY_SOUNDS = {"critical": "Alarm", "normal": "Ping", "low": "Pop"}
+_APPLESCRIPT_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+_DBUS_URGENCY = {"low": 0, "normal": 1, "critical": 2}
+_DBUS_ICONS = {
+    "low": "dialog-information",
+    "normal": "appointment-soon",
+    "critical": "dialog-warning",
+}
+
+# Players in preference order: aplay (ALSA, universal), paplay (PulseAudio), pw-play (PipeWire)
+_LINUX_PLAYERS = (
+    ("aplay", "-q", "-"),
+    ("paplay", "--raw", "--rate=44100", "--channels=1", "--format=s16le"),
+    ("pw-play", "--rate=44100", "--channels=1", "--format=s16", "-"),
+)
+
+
+def _truncate(text: str, limit: int = 150) -> str:
+    """Shorten text to at most `limit` characters, marking the cut with '...'."""
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def _is_running(child: int | subprocess.Popen) -> bool:
+    """Poll a background process without blocking, reaping it if it exited."""
+    if isinstance(child, subprocess.Popen):
+        return child.poll() is None
+    try:
+        pid, _ = os.waitpid(child, os.WNOHANG)
+    except ChildProcessError:
+        return False
+    return pid == 0
+
+
+def _find_linux_players() -> list[list[str]]:
+    """Return the argv of every installed sound player, in preference order."""
+    players = []
+    for cmd in _LINUX_PLAYERS:
+        path = shutil.which(cmd[0])
+        if path:
+            players.append([path, *cmd[1:]])
+    return players
 
 
 class NotificationManager:
@@ -54,6 +165,31 @@ class NotificationManager:
         self.app_name = app_name
         self.platform_info = get_platform()
         self.notifications_available = Notify is not None
+        # Background processes still running: pids from posix_spawn, or Popen objects
+        self._children: list[int | subprocess.Popen] = []
+        self._children_lock = threading.Lock()
+        # Sounds play on a worker thread; a full queue drops the alert
+        self._sound_queue: queue.Queue[str] = queue.Queue(maxsize=4)
+        self._sound_worker: threading.Thread | None = None
+        self._linux_players: list[list[str]] = []
+        self._dbus_iface = None
+        # title -> (monotonic time, message, D-Bus notification id) of the last send
+        self._recent: dict[str, tuple[float, str, int]] = {}
+        if self.platform_info.is_linux:
+            self._linux_players = _find_linux_players()
+
+        # Pick the platform backends once instead of branching per notification
+        if self.platform_info.is_macos:
+            self._notify_impl = self._notify_macos
+            self._sound_impl = self._play_sound_macos
+        elif self.platform_info.is_linux:
+            self._notify_impl = self._notify_linux
+            self._sound_impl = self._play_sound_linux
+        else:
+            self._notify_impl = (
+                self._notify_notifypy if self.notifications_available else self._notify_console
+            )
+            self._sound_impl = None
 
         if not self.notifications_available and strict:
             raise ImportError("notify-py not installed. Install with: pip install notify-py")
@@ -63,58 +199,123 @@ class NotificationManager:
         return self.notifications_available
 
     def _play_sound(self, urgency: str = "normal") -> None:
-        """Play an alert sound. Best-effort, never raises."""
+        """Queue an alert sound for the worker thread. Best-effort, never raises."""
+        if self._sound_impl is None:
+            return
+        if self._sound_worker is None:
+            self._sound_worker = threading.Thread(
+                target=self._run_sound_worker, name="remind-sound", daemon=True
+            )
+            self._sound_worker.start()
         try:
-            if self.platform_info.is_macos:
-                self._play_sound_macos(urgency)
-            elif self.platform_info.is_linux:
-                self._play_sound_linux(urgency)
-        except Exception:
-            pass
+            self._sound_queue.put_nowait(urgency)
+        except queue.Full:
+            pass  # already beeping; don't build up a backlog
+
+    def _run_sound_worker(self) -> None:
+        """Play queued sounds one at a time."""
+        while True:
+            urgency = self._sound_queue.get()
+            try:
+                self._sound_impl(urgency)
+            except Exception:
+                pass
 
-    def _play_sound_macos(self, urgency: str) -> None:
-        """Play sound on macOS using afplay."""
-        sounds = {"critical": "Glass", "normal": "Ping", "low": "Pop"}
-        sound = sounds.get(urgency, "Ping")
-        subprocess.run(
-            ["afplay", f"/System/Library/Sounds/{sound}.aiff"],
-            timeout=10,
-            capture_output=True,
+    def _spawn(self, argv: list[str], stdin_data: bytes | None = None) -> None:
+        """Start a detached process with output discarded, without waiting on it.
+
+        Uses os.posix_spawnp where available, which skips the fork that
+        subprocess falls back to on some platforms (notably macOS).
+
+        Raises:
+            FileNotFoundError: If the executable is not on PATH
+        """
+        if not hasattr(os, "posix_spawnp"):
+            self._spawn_popen(argv, stdin_data)
+            return
+
+        devnull = os.open(os.devnull, os.O_RDWR)
+        read_fd, write_fd = os.pipe() if stdin_data is not None else (devnull, None)
+        actions = [
+            (os.POSIX_SPAWN_DUP2, read_fd, 0),
+            (os.POSIX_SPAWN_DUP2, devnull, 1),
+            (os.POSIX_SPAWN_DUP2, devnull, 2),
+        ]
+        try:
+            pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=actions, setsid=True)
+            if write_fd is not None:
+                # The tone fits in the pipe buffer, so this write doesn't block
+                os.write(write_fd, stdin_data)
+        except NotImplementedError:
+            pid = None  # no POSIX_SPAWN_SETSID on this platform
+        except BrokenPipeError:
+            pass  # player exited early; still reap it below
+        finally:
+            os.close(devnull)
+            if write_fd is not None:
+                os.close(read_fd)
+                os.close(write_fd)
+
+        if pid is None:
+            self._spawn_popen(argv, stdin_data)
+        else:
+            self._track(pid)
+
+    def _spawn_popen(self, argv: list[str], stdin_data: bytes | None = None) -> None:
+        """subprocess-based fallback for _spawn."""
+        proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.DEVNULL if stdin_data is None else subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
+        if stdin_data is not None:
+            proc.stdin.write(stdin_data)
+            proc.stdin.close()
+        self._track(proc)
+
+    def _track(self, child: int | subprocess.Popen) -> None:
+        """Remember a background process, collecting ones that have exited."""
+        with self._children_lock:
+            self._children = [c for c in self._children if _is_running(c)]
+            self._children.append(child)
+
+    def _play_sound_macos(self, urgency: str) -> None:
+        """Play sound on macOS using afplay, without waiting for it to finish."""
+        sound = _MACOS_ALERT_SOUNDS.get(urgency, "Ping")
+        self._spawn(["afplay", f"/System/Library/Sounds/{sound}.aiff"])
 
     def _play_sound_linux(self, urgency: str) -> None:
         """Play sound on Linux using aplay with generated WAV data.
 
         aplay is part of alsa-utils, installed by default on virtually
-        every desktop Linux distribution.
+        every desktop Linux distribution. This runs on the sound worker
+        thread, so it waits for each player and falls through to the next
+        one (paplay, pw-play) when a player fails, e.g. aplay without an
+        ALSA device on a PulseAudio/PipeWire-only system.
         """
-        tones = {
-            "critical": (880, 300, 0.7),
-            "normal": (660, 300, 0.5),
-            "low": (440, 200, 0.3),
-        }
-        freq, duration, vol = tones.get(urgency, (660, 300, 0.5))
-        wav_data = _generate_wav(freq, duration, vol)
-
-        # Try players in order: aplay (ALSA, universal), paplay (PulseAudio), pw-play (PipeWire)
-        for player_cmd in [
-            ["aplay", "-q", "-"],
-            ["paplay", "--raw", "--rate=44100", "--channels=1", "--format=s16le"],
-            ["pw-play", "--rate=44100", "--channels=1", "--format=s16", "-"],
-        ]:
+        wav_data = _WAV.get(urgency) or _WAV.get("normal")
+        if wav_data is None:
+            wav_data = _generate_wav(*_TONES.get(urgency, _TONES["normal"]))
+
+        # Use the players found at startup; probe again only if none were found
+        candidates = self._linux_players or _LINUX_PLAYERS
+        for player_cmd in candidates:
             try:
-                proc = subprocess.run(
-                    player_cmd,
+                result = subprocess.run(
+                    list(player_cmd),
                     input=wav_data,
-                    timeout=10,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=_SOUND_TIMEOUT_SECONDS,
                 )
-                if proc.returncode == 0:
-                    return
             except FileNotFoundError:
                 continue
             except Exception:
                 continue
+            if result.returncode == 0:
+                return
 
     def notify(
         self,
@@ -125,33 +326,44 @@ class NotificationManager:
         sound: bool = False,
     ) -> bool:
         """Send a native desktop notification."""
+        now = time.monotonic()
+        last = self._recent.get(title)
+        if last and last[1] == message and now - last[0] < _DEBOUNCE_SECONDS:
+            # Same notification again: update the shown one in place where
+            # D-Bus lets us, otherwise drop the duplicate
+            self._recent[title] = (now, message, last[2])
+            if last[2] and self._notify_impl == self._notify_linux:
+                return self._notify_linux(title, message, urgency, replaces_id=last[2])
+            return True
+        self._recent[title] = (now, message, 0)
+
         if sound:
             self._play_sound(urgency)
 
         try:
-            if self.platform_info.is_macos:
-                return self._notify_macos(title, message, urgency)
-            elif self.platform_info.is_linux:
-                return self._notify_linux(title, message, urgency)
-            elif self.notifications_available:
-                notification = Notify()
-                notification.title = title
-                notification.message = message
-                notification.app_name = self.app_name
-                notification.send()
-                return True
-            else:
-                print(f"[{title}] {message}")
-                return False
+            return self._notify_impl(title, message, urgency)
         except Exception as e:
             print(f"Warning: Error sending notification: {e}")
             return False
 
+    def _notify_notifypy(self, title: str, message: str, urgency: str = "normal") -> bool:
+        """Send a notification through notify-py."""
+        notification = Notify()
+        notification.title = title
+        notification.message = message
+        notification.app_name = self.app_name
+        notification.send()
+        return True
+
+    def _notify_console(self, title: str, message: str, urgency: str = "normal") -> bool:
+        """Print the notification when no backend is available."""
+        print(f"[{title}] {message}")
+        return False
+
     def _notify_macos(self, title: str, message: str, urgency: str = "normal") -> bool:
         """Send macOS notification using AppleScript."""
-        message_escaped = message.replace('"', '\\"')
-        urgency_sound = {"critical": "Alarm", "normal": "Ping", "low": "Pop"}
-        sound = urgency_sound.get(urgency, "Ping")
+        message_escaped = message.translate(_APPLESCRIPT_ESCAPE)
+        sound = _MACOS_NOTIFY_SOUNDS.get(urgency, "Ping")
         script = f'display notification "{message_escaped}" with title "Remind" sound name "{sound}"'
 
         try:
@@ -165,41 +377,40 @@ class NotificationManager:
         except Exception:
             return False
 
-    def _notify_linux(self, title: str, message: str, urgency: str = "normal") -> bool:
+    def _notify_linux(
+        self, title: str, message: str, urgency: str = "normal", replaces_id: int = 0
+    ) -> bool:
         """Send Linux notification using D-Bus, with notify-send fallback."""
-        try:
-            import dbus
-            from dbus.exceptions import DBusException
-        except ImportError:
+        if dbus is None:
             return self._notify_linux_notify_send(title, message, urgency)
 
         try:
-            bus = dbus.SessionBus()
-            notify_object = bus.get_object(
-                "org.freedesktop.Notifications", "/org/freedesktop/Notifications"
-            )
-            notify_interface = dbus.Interface(notify_object, "org.freedesktop.Notifications")
+            # Connect once and reuse the session bus for later notifications
+            if self._dbus_iface is None:
+                bus = dbus.SessionBus()
+                notify_object = bus.get_object(
+                    "org.freedesktop.Notifications", "/org/freedesktop/Notifications"
+                )
+                self._dbus_iface = dbus.Interface(notify_object, "org.freedesktop.Notifications")
+            notify_interface = self._dbus_iface
 
-            urgency_map = {"low": 0, "normal": 1, "critical": 2}
-            dbus_urgency = urgency_map.get(urgency, 1)
+            dbus_urgency = _DBUS_URGENCY.get(urgency, 1)
 
             hints = {
                 "urgency": dbus.Byte(dbus_urgency),
                 "desktop-entry": dbus.String("remind"),
             }
 
-            icon_map = {
-                "low": "dialog-information",
-                "normal": "appointment-soon",
-                "critical": "dialog-warning",
-            }
-            icon = icon_map.get(urgency, "dialog-information")
+            icon = _DBUS_ICONS.get(urgency, "dialog-information")
 
-            notify_interface.Notify(
-                "Remind", 0, icon, title, message, [], hints, 5000,
+            notification_id = notify_interface.Notify(
+                "Remind", replaces_id, icon, title, message, [], hints, 5000,
             )
+            if title in self._recent:
+                self._recent[title] = (*self._recent[title][:2], int(notification_id))
             return True
         except (DBusException, Exception):
+            self._dbus_iface = None  # reconnect on the next notification
             return self._notify_linux_notify_send(title, message, urgency)
 
     def _notify_linux_notify_send(
@@ -207,20 +418,16 @@ class NotificationManager:
     ) -> bool:
         """Fallback: Use notify-send command for Linux notifications."""
         try:
-            urgency_map = {"low": "low", "normal": "normal", "critical": "critical"}
-            urgency_str = urgency_map.get(urgency, "normal")
+            urgency_str = urgency if urgency in _DBUS_URGENCY else "normal"
 
-            subprocess.run(
+            self._spawn(
                 [
                     "notify-send",
                     "--urgency", urgency_str,
                     "--app-name", "Remind",
                     title,
                     message,
-                ],
-                timeout=5,
-                capture_output=True,
-                check=False,
+                ]
             )
             return True
         except FileNotFoundError:
@@ -232,7 +439,7 @@ class NotificationManager:
         self, reminder_text: str, sound: bool = False, callback: Callable | None = None
     ) -> bool:
         """Send a notification for a due reminder."""
-        message = reminder_text[:150] + ("..." if len(reminder_text) > 150 else "")
+        message = _truncate(reminder_text)
         return self.notify(
             title="Remind",
             message=message,
@@ -243,7 +450,7 @@ class NotificationManager:
 
     def notify_nudge(self, reminder_text: str, sound: bool = False) -> bool:
         """Send a nudge notification for an escalated reminder."""
-        message = reminder_text[:150] + ("..." if len(reminder_text) > 150 else "")
+        message = _truncate(reminder_text)
         return self.notify(
             title="Remind - Still Due",
             message=message,
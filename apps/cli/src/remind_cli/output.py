@@ -8,13 +8,11 @@ Provides a cohesive editorial design language matching the remind.hamzaplojovic.
 - Solid/dotted rules as dividers — no emoji clutter
 """
 
-import json
-import sys
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 
 from rich.console import Console
-from rich.table import Table
 from rich.theme import Theme
 from rich.text import Text
 
@@ -41,13 +39,26 @@ _THEME = Theme(
 )
 
 console = Console(theme=_THEME, highlight=False)
-_stderr = Console(theme=_THEME, highlight=False, file=sys.stderr)
+# stderr=True resolves sys.stderr on each write, so redirected streams are honoured
+_stderr = Console(theme=_THEME, highlight=False, stderr=True)
 
 # ── Branding ─────────────────────────────────────────────────────────
 BRAND = Text.assemble(("remind", "bold"), (".", "accent"))
 RULE_CHAR = "─"
 DOT_CHAR = "·"
 
+# Pre-styled markers, built once instead of re-parsing markup per message/row
+_SUCCESS_PREFIX = Text.assemble("  ", ("✓", "success"))
+_ERROR_PREFIX = Text.assemble("  ", ("✗", "error"))
+_WARNING_PREFIX = Text.assemble("  ", ("!", "warning"))
+_DONE_MARK = Text("✓", style="success")
+_OPEN_MARK = Text("○", style="muted")
+_PRIORITY_TEXT = {
+    "high": Text("HIGH", style="priority.high"),
+    "medium": Text("MED", style="priority.medium"),
+    "low": Text("LOW", style="priority.low"),
+}
+
 
 # ── Primitives ───────────────────────────────────────────────────────
 
@@ -81,27 +92,38 @@ def header(title: str) -> None:
     rule()
 
 
+@lru_cache(maxsize=256)
+def _pad_label(label: str, width: int) -> str:
+    """Uppercase and pad a label; labels repeat across a session."""
+    return label.upper().ljust(width)
+
+
+@lru_cache(maxsize=256)
+def _styled_prefix(label: str, width: int, style: str) -> Text:
+    """Indented, padded and styled row prefix, built once per label."""
+    return Text.assemble("  ", (label.ljust(width), style))
+
+
 def label_value(label: str, value: str, label_width: int = 18) -> None:
     """Print a label-value pair: LABEL  value."""
-    padded = label.upper().ljust(label_width)
-    console.print(f"  [label]{padded}[/label] {value}")
+    console.print(_styled_prefix(_pad_label(label, label_width), 0, "label"), value)
 
 
 # ── Messaging ────────────────────────────────────────────────────────
 
 def success(message: str) -> None:
     """Print a success message: ✓ message."""
-    console.print(f"  [success]✓[/success] {message}")
+    console.print(_SUCCESS_PREFIX, message)
 
 
 def error(message: str) -> None:
     """Print an error message: ✗ message."""
-    _stderr.print(f"  [error]✗[/error] {message}")
+    _stderr.print(_ERROR_PREFIX, message)
 
 
 def warning(message: str) -> None:
     """Print a warning message: ! message."""
-    _stderr.print(f"  [warning]![/warning] {message}")
+    _stderr.print(_WARNING_PREFIX, message)
 
 
 def info(message: str) -> None:
@@ -126,24 +148,61 @@ def ai_suggestion(suggestion: str) -> None:
 
 # ── Priority ─────────────────────────────────────────────────────────
 
-def format_priority(priority_value: str) -> str:
-    """Return Rich markup for a priority level."""
-    styles = {
-        "high": "[priority.high]HIGH[/priority.high]",
-        "medium": "[priority.medium]MED[/priority.medium]",
-        "low": "[priority.low]LOW[/priority.low]",
-    }
-    return styles.get(priority_value, f"[muted]{priority_value.upper()}[/muted]")
+def format_priority(priority_value: str) -> Text:
+    """Return a styled Text for a priority level."""
+    cached = _PRIORITY_TEXT.get(priority_value)
+    if cached is not None:
+        return cached
+    return Text(priority_value.upper(), style="muted")
 
 
 # ── Tables ───────────────────────────────────────────────────────────
 
-def reminders_table(rows: list[dict]) -> None:
+# Above this many rows reminders_table prints fixed-width lines instead of a Table
+_STREAM_THRESHOLD = 500
+_STREAM_CHUNK = 200
+_ID_WIDTH = 5
+_DUE_WIDTH = 16
+_PRI_WIDTH = 4
+
+
+def reminders_table(rows: list[dict], has_done: bool | None = None) -> None:
     """Print a branded reminders table.
 
     Args:
         rows: List of dicts with keys: id, text, due, priority, done (optional)
+        has_done: Whether to show the done column. Detected from the rows
+            while building cells when not given.
     """
+    # Build all cells in one pass, noting whether any row carries "done"
+    detect = has_done is None
+    done_seen = False
+    row_cells = []
+    for row in rows:
+        done = row.get("done")
+        if detect and done is not None:
+            done_seen = True
+        # Cells are plain Text, so Rich never lexes reminder text as markup
+        row_cells.append(
+            (
+                Text(str(row["id"])),
+                _DONE_MARK if done else _OPEN_MARK,
+                Text(row["text"]),
+                Text(row.get("due", "")),
+                format_priority(row.get("priority", "medium")),
+            )
+        )
+    if detect:
+        has_done = done_seen
+
+    if len(row_cells) > _STREAM_THRESHOLD:
+        _stream_reminder_rows(row_cells, has_done)
+        blank()
+        info(f"{len(rows)} reminders")
+        return
+
+    from rich.table import Table
+
     table = Table(
         show_header=True,
         header_style="table.header",
@@ -153,22 +212,17 @@ def reminders_table(rows: list[dict]) -> None:
         pad_edge=True,
     )
     table.add_column("ID", style="muted", width=5, justify="right")
-    has_done = any("done" in r for r in rows)
     if has_done:
         table.add_column("", width=2)
     table.add_column("TEXT", min_width=20)
     table.add_column("DUE", style="muted", min_width=14)
     table.add_column("PRI", min_width=6)
 
-    for row in rows:
-        cells = [str(row["id"])]
+    for cells in row_cells:
         if has_done:
-            done_mark = "[success]✓[/success]" if row.get("done") else "[muted]○[/muted]"
-            cells.append(done_mark)
-        cells.append(row["text"])
-        cells.append(row.get("due", ""))
-        cells.append(format_priority(row.get("priority", "medium")))
-        table.add_row(*cells)
+            table.add_row(*cells)
+        else:
+            table.add_row(cells[0], *cells[2:])
 
     console.print()
     console.print(table)
@@ -176,8 +230,56 @@ def reminders_table(rows: list[dict]) -> None:
     info(f"{len(rows)} reminder{'s' if len(rows) != 1 else ''}")
 
 
+def _stream_reminder_rows(row_cells: list[tuple], has_done: bool) -> None:
+    """Print reminder rows as fixed-width lines, in chunks.
+
+    Used for very long lists, where Rich's Table would hold every row and
+    measure the whole dataset before printing anything.
+    """
+    fixed = 2 + _ID_WIDTH + (2 + 2 if has_done else 0) + 2 + 2 + _DUE_WIDTH + 2 + _PRI_WIDTH
+    text_width = max(20, console.width - fixed)
+    gap = "  "
+
+    head = ["  ", _pad_label("id", _ID_WIDTH).rjust(_ID_WIDTH), gap]
+    if has_done:
+        head += ["  ", gap]
+    head += [
+        _pad_label("text", text_width),
+        gap,
+        _pad_label("due", _DUE_WIDTH),
+        gap,
+        _pad_label("pri", _PRI_WIDTH),
+    ]
+    console.print()
+    console.print(Text("".join(head), style="table.header"))
+
+    newline = Text("\n")
+    for start in range(0, len(row_cells), _STREAM_CHUNK):
+        lines = []
+        for id_text, mark, body, due, priority in row_cells[start : start + _STREAM_CHUNK]:
+            body = body.copy()
+            body.truncate(text_width, overflow="ellipsis", pad=True)
+            line = Text.assemble(
+                "  ",
+                (id_text.plain.rjust(_ID_WIDTH), "muted"),
+                gap,
+            )
+            if has_done:
+                line.append_text(mark)
+                line.append(" " + gap)
+            line.append_text(body)
+            line.append(gap)
+            line.append(due.plain.ljust(_DUE_WIDTH), "muted")
+            line.append(gap)
+            line.append_text(priority)
+            lines.append(line)
+        console.print(newline.join(lines), soft_wrap=True)
+
+
 def key_value_table(data: dict[str, str], title: str | None = None) -> None:
     """Print a clean key-value table (for reports, settings, etc.)."""
+    from rich.table import Table
+
     table = Table(
         show_header=bool(title),
         header_style="table.header",
@@ -192,7 +294,7 @@ def key_value_table(data: dict[str, str], title: str | None = None) -> None:
     table.add_column("")
 
     for key, value in data.items():
-        table.add_row(key.upper(), str(value))
+        table.add_row(_pad_label(key, 0), str(value))
 
     console.print()
     console.print(table)
@@ -202,7 +304,8 @@ def key_value_table(data: dict[str, str], title: str | None = None) -> None:
 
 def print_json(data: object) -> None:
     """Pretty-print JSON data."""
-    console.print_json(json.dumps(data, indent=2, default=str))
+    # Rich serializes the object itself; no dumps-then-parse round trip
+    console.print_json(data=data, indent=2, default=str)
 
 
 # ── Spinner ──────────────────────────────────────────────────────────
@@ -218,5 +321,4 @@ def spinner(message: str) -> Generator[None, None, None]:
 
 def command_row(cmd: str, desc: str, cmd_width: int = 30) -> None:
     """Print a single command + description row for help screens."""
-    padded = cmd.ljust(cmd_width)
-    console.print(f"  [accent]{padded}[/accent] [muted]{desc}[/muted]")
+    console.print(_styled_prefix(cmd, cmd_width, "accent"), f"[muted]{desc}[/muted]")
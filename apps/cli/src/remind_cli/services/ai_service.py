@@ -1,23 +1,78 @@
 """AI service for reminder suggestions."""
 
-import httpx
+import atexit
+from typing import TYPE_CHECKING
 
-from remind_shared import AIResponse, PriorityLevel
+from remind_shared import AIResponse, Config, PriorityLevel
 from remind_cli.config import load_config
 from remind_cli.services.config_service import ConfigService
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:
+    import httpx  # imported lazily: most commands never reach the backend
+
+# Shared across suggestions so repeat calls reuse the pooled TLS connection
+_CLIENT: "httpx.Client | None" = None
+
+
+def _get_client() -> "httpx.Client":
+    """Return the process-wide backend HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+
+        _CLIENT = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30),
+        )
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+def _backend_errors() -> tuple[type[Exception], ...]:
+    """Failures that mean "no usable suggestion": network trouble or a bad payload.
+
+    ValueError also covers malformed JSON and unknown priority values, and
+    TypeError a field of the wrong type (e.g. a non-numeric cost_cents).
+    """
+    import httpx
+
+    return (httpx.HTTPError, httpx.InvalidURL, ValueError, KeyError, TypeError)
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _post_json(client, url: str, payload: dict):
+    """POST a JSON body, serialized with orjson when it's installed."""
+    if orjson is None:
+        return client.post(url, json=payload)
+    return client.post(url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
+
 
 class AIService:
     """Service for AI-powered reminder suggestions."""
 
-    def __init__(self, backend_url: str | None = None, openai_key: str | None = None):
+    def __init__(
+        self,
+        backend_url: str | None = None,
+        openai_key: str | None = None,
+        config_service: ConfigService | None = None,
+    ):
         self.backend_url = backend_url
         self.openai_key = openai_key
+        self._config_service = config_service or ConfigService()
 
     def suggest_reminder(self, text: str) -> AIResponse:
         """Get AI suggestion for reminder text."""
-        backend_url = self.backend_url or self._get_configured_backend_url()
-        openai_key = self.openai_key or self._get_configured_openai_key()
+        # Read the config file at most once per suggestion
+        config = None if self.backend_url and self.openai_key else self._get_config()
+        backend_url = self.backend_url or (config.ai_backend_url if config else None)
+        openai_key = self.openai_key or (config.openai_api_key if config else None)
 
         if backend_url:
             return self._suggest_via_backend(text, backend_url)
@@ -30,57 +85,51 @@ class AIService:
                 quota_exhausted=False,
             )
 
-    def _get_configured_backend_url(self) -> str | None:
+    def _get_config(self) -> Config | None:
         try:
-            config = load_config()
-            return config.ai_backend_url
-        except Exception:
-            return None
-
-    def _get_configured_openai_key(self) -> str | None:
-        try:
-            config = load_config()
-            return config.openai_api_key
+            return load_config()
         except Exception:
             return None
 
     def _suggest_via_backend(self, text: str, backend_url: str) -> AIResponse:
         """Get suggestion from Remind backend API."""
+        license_token = self._config_service.get_license_token()
+        if not license_token:
+            return AIResponse(
+                suggested_text=text,
+                priority=PriorityLevel.MEDIUM,
+            )
+
+        client = _get_client()
         try:
-            config_service = ConfigService()
-            license_token = config_service.get_license_token()
-            if not license_token:
+            response = _post_json(
+                client,
+                f"{backend_url.rstrip('/')}/api/v1/suggest-reminder",
+                {"license_token": license_token, "reminder_text": text},
+            )
+
+            if response.status_code == 429:
                 return AIResponse(
                     suggested_text=text,
                     priority=PriorityLevel.MEDIUM,
+                    quota_exhausted=True,
                 )
-
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    f"{backend_url.rstrip('/')}/api/v1/suggest-reminder",
-                    json={"license_token": license_token, "reminder_text": text},
-                )
-
-                if response.status_code == 429:
-                    return AIResponse(
-                        suggested_text=text,
-                        priority=PriorityLevel.MEDIUM,
-                        quota_exhausted=True,
-                    )
-                elif response.status_code != 200:
-                    return AIResponse(
-                        suggested_text=text,
-                        priority=PriorityLevel.MEDIUM,
-                    )
-
-                data = response.json()
+            elif response.status_code != 200:
                 return AIResponse(
-                    suggested_text=data.get("suggested_text", text),
-                    priority=PriorityLevel(data.get("priority", "medium")),
-                    due_time_suggestion=data.get("due_time_suggestion"),
-                    cost_estimate=data.get("cost_cents", 0) / 100.0 if data.get("cost_cents") else None,
+                    suggested_text=text,
+                    priority=PriorityLevel.MEDIUM,
                 )
-        except Exception:
+
+            data = response.json()
+            if not isinstance(data, dict):
+                raise ValueError("suggestion payload is not a JSON object")
+            return AIResponse(
+                suggested_text=data.get("suggested_text", text),
+                priority=PriorityLevel(data.get("priority", "medium")),
+                due_time_suggestion=data.get("due_time_suggestion"),
+                cost_estimate=data.get("cost_cents", 0) / 100.0 if data.get("cost_cents") else None,
+            )
+        except _backend_errors():
             return AIResponse(
                 suggested_text=text,
                 priority=PriorityLevel.MEDIUM,
@@ -1,9 +1,18 @@
 """Configuration management service."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Config dirs already ensured by this process, so repeat instances skip the mkdir
+_created_dirs: set[Path] = set()
+
 
 class ConfigService:
     """Service for managing CLI configuration."""
@@ -12,52 +21,73 @@ class ConfigService:
         """Initialize config service."""
         self.config_dir = Path.home() / ".remind"
         self.config_file = self.config_dir / "config.json"
-        self.config_dir.mkdir(exist_ok=True)
+        if self.config_dir not in _created_dirs:
+            self.config_dir.mkdir(exist_ok=True)
+            _created_dirs.add(self.config_dir)
+        # (mtime_ns, parsed config) of the last read or write
+        self._cache: tuple[int, dict] | None = None
 
     def get_config_path(self) -> str:
         """Get path to config file."""
         return str(self.config_file)
 
     def load_config(self) -> dict:
-        """Load configuration from file."""
-        if not self.config_file.exists():
+        """Load configuration from file.
+
+        The parsed file is reused until its mtime changes, so callers must
+        not mutate the returned dict.
+        """
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except OSError:
+            self._cache = None
             return {}
+        if self._cache and self._cache[0] == mtime:
+            return self._cache[1]
 
         try:
-            with open(self.config_file, "r") as f:
-                return json.load(f)
+            if orjson is not None:
+                config = orjson.loads(self.config_file.read_bytes())
+            else:
+                with open(self.config_file, "r") as f:
+                    config = json.load(f)
         except Exception:
             return {}
+        self._cache = (mtime, config)
+        return config
 
     def save_config(self, config: dict) -> None:
-        """Save configuration to file."""
-        with open(self.config_file, "w") as f:
-            json.dump(config, f, indent=2)
+        """Save configuration to file.
+
+        Writes a temp file and renames it over the config, so a crash
+        mid-write can't leave a truncated file behind.
+        """
+        tmp = self.config_file.with_suffix(".json.tmp")
+        if orjson is not None:
+            tmp.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            tmp.write_text(json.dumps(config, indent=2))
+        os.replace(tmp, self.config_file)
+        self._cache = (self.config_file.stat().st_mtime_ns, config)
 
     def get_license_token(self) -> str | None:
         """Get stored license token."""
-        config = self.load_config()
-        return config.get("license_token")
+        return self.load_config().get("license_token")
 
     def set_license_token(self, token: str) -> None:
         """Save license token."""
-        config = self.load_config()
-        config["license_token"] = token
-        self.save_config(config)
+        self.save_config({**self.load_config(), "license_token": token})
 
     def clear_license_token(self) -> None:
         """Clear stored license token."""
-        config = self.load_config()
+        config = dict(self.load_config())
         config.pop("license_token", None)
         self.save_config(config)
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a configuration setting."""
-        config = self.load_config()
-        return config.get(key, default)
+        return self.load_config().get(key, default)
 
     def set_setting(self, key: str, value: Any) -> None:
         """Set a configuration setting."""
-        config = self.load_config()
-        config[key] = value
-        self.save_config(config)
+        self.save_config({**self.load_config(), key: value})
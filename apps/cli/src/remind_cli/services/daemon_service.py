@@ -1,6 +1,8 @@
 """Daemon scheduler service installation and management."""
 
 import os
+import shutil
+import string
 import subprocess
 import sys
 from pathlib import Path
@@ -8,6 +10,52 @@ from pathlib import Path
 from remind_cli.platform_utils import get_platform, get_logs_dir
 from remind_cli.utils import ensure_dir, run_command
 
+_PLIST_TEMPLATE = string.Template(
+    """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>com.remind.scheduler</string>
+    <key>Program</key>
+    <string>$remind_path</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>$remind_path</string>
+        <string>scheduler</string>
+        <string>--run</string>
+    </array>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>KeepAlive</key>
+    <true/>
+    <key>StandardOutPath</key>
+    <string>$logs_dir/scheduler.log</string>
+    <key>StandardErrorPath</key>
+    <string>$logs_dir/scheduler.error.log</string>
+</dict>
+</plist>
+"""
+)
+
+_SERVICE_TEMPLATE = string.Template(
+    """[Unit]
+Description=Remind - Background Reminder Scheduler
+After=network.target
+
+[Service]
+Type=simple
+ExecStart=$remind_path scheduler --run
+Restart=always
+RestartSec=10
+StandardOutput=journal
+StandardError=journal
+
+[Install]
+WantedBy=default.target
+"""
+)
+
 
 class DaemonService:
     """Install and manage background reminder scheduler."""
@@ -15,6 +63,7 @@ class DaemonService:
     def __init__(self):
         """Initialize daemon service."""
         self.platform = get_platform()
+        self._installed_cache: bool | None = None
 
     def install(self) -> bool:
         """Install scheduler as a background service.
@@ -23,11 +72,14 @@ class DaemonService:
             True if installation successful, False otherwise
         """
         if self.platform.is_macos:
-            return self._install_macos_agent()
+            ok = self._install_macos_agent()
         elif self.platform.is_linux:
-            return self._install_linux_service()
+            ok = self._install_linux_service()
         else:
             return False
+        if ok:
+            self._installed_cache = True
+        return ok
 
     def uninstall(self) -> bool:
         """Uninstall scheduler background service.
@@ -36,11 +88,14 @@ class DaemonService:
             True if uninstallation successful, False otherwise
         """
         if self.platform.is_macos:
-            return self._uninstall_macos_agent()
+            ok = self._uninstall_macos_agent()
         elif self.platform.is_linux:
-            return self._uninstall_linux_service()
+            ok = self._uninstall_linux_service()
         else:
             return False
+        if ok:
+            self._installed_cache = False
+        return ok
 
     def is_installed(self) -> bool:
         """Check if scheduler service is installed.
@@ -48,6 +103,12 @@ class DaemonService:
         Returns:
             True if service is installed
         """
+        if self._installed_cache is None:
+            self._installed_cache = self._check_installed()
+        return self._installed_cache
+
+    def _check_installed(self) -> bool:
+        """Look for the service file on disk."""
         if self.platform.is_macos:
             plist_path = Path.home() / "Library" / "LaunchAgents" / "com.remind.scheduler.plist"
             return plist_path.exists()
@@ -77,48 +138,16 @@ class DaemonService:
             plist_path = la_dir / "com.remind.scheduler.plist"
             logs_dir = get_logs_dir()
 
-            plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.remind.scheduler</string>
-    <key>Program</key>
-    <string>{remind_path}</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{remind_path}</string>
-        <string>scheduler</string>
-        <string>--run</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <true/>
-    <key>StandardOutPath</key>
-    <string>{logs_dir}/scheduler.log</string>
-    <key>StandardErrorPath</key>
-    <string>{logs_dir}/scheduler.error.log</string>
-</dict>
-</plist>
-"""
-
             # Write plist file
-            plist_path.write_text(plist_content)
+            plist_path.write_text(
+                _PLIST_TEMPLATE.substitute(remind_path=remind_path, logs_dir=logs_dir)
+            )
 
-            # Load the service
-            try:
-                run_command(["launchctl", "load", str(plist_path)])
-                return True
-            except subprocess.CalledProcessError:
-                # If load fails, try unloading first (in case it's already there)
-                try:
-                    run_command(["launchctl", "unload", str(plist_path)], check=False)
-                except Exception:
-                    pass
-                # Then load again
-                run_command(["launchctl", "load", str(plist_path)])
-                return True
+            # Load the service, booting out any previous copy first
+            domain = f"gui/{os.getuid()}"
+            run_command(["launchctl", "bootout", domain, str(plist_path)], check=False)
+            run_command(["launchctl", "bootstrap", domain, str(plist_path)])
+            return True
 
         except Exception:
             return False
@@ -141,33 +170,23 @@ class DaemonService:
             # Create service file
             service_path = sd_dir / "remind-scheduler.service"
 
-            service_content = f"""[Unit]
-Description=Remind - Background Reminder Scheduler
-After=network.target
-
-[Service]
-Type=simple
-ExecStart={remind_path} scheduler --run
-Restart=always
-RestartSec=10
-StandardOutput=journal
-StandardError=journal
-
-[Install]
-WantedBy=default.target
-"""
-
             # Write service file
-            service_path.write_text(service_content)
+            service_path.write_text(_SERVICE_TEMPLATE.substitute(remind_path=remind_path))
             service_path.chmod(0o644)
 
             # Ensure logs directory exists
             get_logs_dir()
 
-            # Reload and enable the service
-            run_command(["systemctl", "--user", "daemon-reload"])
-            run_command(["systemctl", "--user", "enable", "remind-scheduler.service"])
-            run_command(["systemctl", "--user", "start", "remind-scheduler.service"])
+            # Enable and start in one call; enable reloads unit files itself
+            try:
+                run_command(
+                    ["systemctl", "--user", "enable", "--now", "remind-scheduler.service"]
+                )
+            except subprocess.CalledProcessError:
+                # Older systemd may not pick up the new unit without an explicit reload
+                run_command(["systemctl", "--user", "daemon-reload"])
+                run_command(["systemctl", "--user", "enable", "remind-scheduler.service"])
+                run_command(["systemctl", "--user", "start", "remind-scheduler.service"])
             return True
 
         except subprocess.CalledProcessError:
@@ -188,10 +207,9 @@ WantedBy=default.target
                 return True  # Already uninstalled
 
             # Unload the service
-            try:
-                run_command(["launchctl", "unload", str(plist_path)])
-            except subprocess.CalledProcessError:
-                pass
+            run_command(
+                ["launchctl", "bootout", f"gui/{os.getuid()}", str(plist_path)], check=False
+            )
 
             # Remove the plist file
             plist_path.unlink()
@@ -216,9 +234,9 @@ WantedBy=default.target
 
             # Stop and disable the service
             try:
-                run_command(["systemctl", "--user", "stop", "remind-scheduler.service"])
-                run_command(["systemctl", "--user", "disable", "remind-scheduler.service"])
-                run_command(["systemctl", "--user", "daemon-reload"])
+                run_command(
+                    ["systemctl", "--user", "disable", "--now", "remind-scheduler.service"]
+                )
             except subprocess.CalledProcessError:
                 pass
 
@@ -243,10 +261,6 @@ WantedBy=default.target
                 return remind_path
 
             # Try to find remind in PATH
-            result = run_command(["which", "remind"], check=False)
-            if result.returncode == 0:
-                return result.stdout.decode().strip()
-
-            return None
+            return shutil.which("remind")
         except Exception:
             return None
@@ -1,5 +1,7 @@
 """Reminder service - business logic for reminder operations."""
 
+import time
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
@@ -10,9 +12,13 @@ from remind_database import ReminderRepository
 class ReminderService:
     """Service layer for reminder operations."""
 
+    __slots__ = ("session", "_repo")
+
     def __init__(self, session: Session):
         """Initialize reminder service with database session."""
         self.session = session
+        # The repository is stateless beyond the session, so one per service suffices
+        self._repo = ReminderRepository(session)
 
     def create_reminder(
         self,
@@ -49,8 +55,7 @@ class ReminderService:
         if due_utc < now and not allow_past_due:
             raise ValidationError("Due date must be in the future")
 
-        repo = ReminderRepository(self.session)
-        return repo.create(
+        return self._repo.create(
             text=text,
             due_at=due_at,
             priority=priority,
@@ -64,21 +69,30 @@ class ReminderService:
         Raises:
             ValidationError: If reminder not found
         """
-        repo = ReminderRepository(self.session)
-        reminder = repo.get_by_id(reminder_id)
+        reminder = self._repo.get_by_id(reminder_id)
         if not reminder:
             raise ValidationError(f"Reminder {reminder_id} not found")
         return reminder
 
     def list_active_reminders(self) -> list[Reminder]:
         """List all active (not done) reminders."""
-        repo = ReminderRepository(self.session)
-        return repo.list_active()
+        return self._repo.list_active()
 
     def list_all_reminders(self) -> list[Reminder]:
         """List all reminders including done ones."""
-        repo = ReminderRepository(self.session)
-        return repo.list_all()
+        return self._repo.list_all()
+
+    def list_reminders_with_status(
+        self, include_done: bool = False, project: str | None = None
+    ) -> list[tuple[Reminder, bool]]:
+        """List reminders with an overdue flag, optionally filtered by project."""
+        return self._repo.list_with_status(include_done, project)
+
+    def list_reminders_page(
+        self, include_done: bool = False, limit: int = 100, offset: int = 0
+    ) -> tuple[list[tuple[Reminder, bool]], int]:
+        """List one page of reminders with overdue flags, plus the total count."""
+        return self._repo.page_with_status(include_done, limit, offset)
 
     def mark_reminder_done(self, reminder_id: int) -> Reminder:
         """Mark a reminder as done.
@@ -86,16 +100,16 @@ class ReminderService:
         Raises:
             ValidationError: If reminder not found
         """
-        repo = ReminderRepository(self.session)
-        reminder = repo.mark_done(reminder_id)
+        reminder = self._repo.mark_done(reminder_id)
         if not reminder:
             raise ValidationError(f"Reminder {reminder_id} not found")
         return reminder
 
-    def search_reminders(self, query: str) -> list[Reminder]:
-        """Search reminders by text."""
-        repo = ReminderRepository(self.session)
-        return repo.search(query)
+    def search_reminders(
+        self, query: str, limit: int | None = None, offset: int = 0, prefix: bool = False
+    ) -> list[Reminder]:
+        """Search reminders by text (only texts starting with `query` if `prefix`)."""
+        return self._repo.search(query, limit=limit, offset=offset, prefix=prefix)
 
     def update_reminder(
         self,
@@ -123,8 +137,7 @@ class ReminderService:
         if text is not None and (not text or len(text) > 1000):
             raise ValidationError("Reminder text must be 1-1000 characters")
 
-        repo = ReminderRepository(self.session)
-        reminder = repo.update(
+        reminder = self._repo.update(
             reminder_id=reminder_id,
             text=text,
             due_at=due_at,
@@ -137,58 +150,117 @@ class ReminderService:
 
     def delete_reminder(self, reminder_id: int) -> bool:
         """Delete a reminder permanently."""
-        repo = ReminderRepository(self.session)
-        return repo.delete(reminder_id)
+        return self._repo.delete(reminder_id)
+
+    def get_overdue_reminders(
+        self, exclude_ids: Iterable[int] = (), now: datetime | None = None
+    ) -> list[Reminder]:
+        """Get all overdue reminders, optionally skipping some IDs.
 
-    def get_overdue_reminders(self) -> list[Reminder]:
-        """Get all overdue reminders."""
-        repo = ReminderRepository(self.session)
-        return repo.get_overdue()
+        ``now`` overrides the current time used as the cut-off.
+        """
+        if exclude_ids:
+            return self._repo.get_overdue_excluding(exclude_ids, now)
+        return self._repo.get_overdue(now)
 
-    def get_upcoming_reminders(self, hours: int = 24) -> list[Reminder]:
-        """Get reminders due within the next N hours."""
-        repo = ReminderRepository(self.session)
-        return repo.get_upcoming(hours)
+    def get_upcoming_reminders(
+        self, hours: int = 24, exclude_ids: Iterable[int] = (), now: datetime | None = None
+    ) -> list[Reminder]:
+        """Get reminders due within the next N hours, optionally skipping some IDs.
 
-    def get_project_reminders(self, project: str, include_done: bool = False) -> list[Reminder]:
+        ``now`` overrides the current time the window starts from.
+        """
+        if exclude_ids:
+            return self._repo.get_upcoming_excluding(exclude_ids, hours, now)
+        return self._repo.get_upcoming(hours, now)
+
+    def get_unnotified_overdue_reminders(self) -> list[Reminder]:
+        """Get overdue reminders the scheduler hasn't notified yet."""
+        return self._repo.get_overdue_unnotified()
+
+    def get_nudge_candidates(
+        self, nudged_before: datetime, hours: int = 24
+    ) -> list[tuple[Reminder, datetime | None, int]]:
+        """Get upcoming reminders with their nudge state, skipping recently nudged ones."""
+        return self._repo.get_nudge_candidates(nudged_before, hours)
+
+    def get_last_nudges(self) -> list[tuple[datetime, int]]:
+        """Get (last nudge time, nudges sent) for active reminders that were nudged."""
+        return self._repo.last_nudges()
+
+    def mark_notified(self, reminder_ids: list[int], at: datetime) -> None:
+        """Record that the scheduler notified these reminders."""
+        self._repo.mark_notified(reminder_ids, at)
+
+    def record_nudges(self, reminder_ids: list[int], at: datetime) -> None:
+        """Record a nudge sent for each of these reminders."""
+        self._repo.record_nudges(reminder_ids, at)
+
+    def get_next_due_at(self) -> datetime | None:
+        """Get when the next active reminder falls due, if any."""
+        return self._repo.next_due_at()
+
+    def get_project_reminders(
+        self, project: str, include_done: bool = False, prefix: bool = False
+    ) -> list[Reminder]:
         """Get reminders filtered by project context."""
-        repo = ReminderRepository(self.session)
-        return repo.get_by_project(project, include_done)
+        return self._repo.get_by_project(project, include_done, prefix=prefix)
 
     def snooze_reminder(self, reminder_id: int, duration: timedelta) -> Reminder:
         """Snooze a reminder by a relative duration from now."""
-        repo = ReminderRepository(self.session)
         new_due = datetime.now() + duration
-        reminder = repo.update(reminder_id=reminder_id, due_at=new_due)
+        reminder = self._repo.update(reminder_id=reminder_id, due_at=new_due)
+        if not reminder:
+            raise ValidationError(f"Reminder {reminder_id} not found")
+        return reminder
+
+    def snooze_reminder_seconds(self, reminder_id: int, seconds: int) -> Reminder:
+        """Snooze a reminder by a number of seconds from now."""
+        new_due = datetime.fromtimestamp(time.time() + seconds)
+        reminder = self._repo.update(reminder_id=reminder_id, due_at=new_due)
         if not reminder:
             raise ValidationError(f"Reminder {reminder_id} not found")
         return reminder
 
     def bulk_complete(self, reminder_ids: list[int]) -> list[Reminder]:
         """Complete multiple reminders at once."""
-        repo = ReminderRepository(self.session)
-        return repo.bulk_mark_done(reminder_ids)
+        return self._repo.bulk_mark_done(reminder_ids)
+
+    def dashboard_snapshot(self, hours: int = 24) -> dict:
+        """Get overdue, upcoming, and summary data from a single query.
+
+        Returns:
+            The get_summary() keys plus 'upcoming' (due within `hours`)
+        """
+        rows = self._repo.list_active_with_windows(hours)
+        snapshot = self._summarize(rows)
+        snapshot["upcoming"] = [r for r, _, is_upcoming, _, _ in rows if is_upcoming]
+        return snapshot
 
     def get_summary(self) -> dict:
         """Get a structured summary of all reminders."""
-        repo = ReminderRepository(self.session)
-        overdue = repo.get_overdue()
-        due_today = repo.get_due_today()
-        due_this_week = repo.get_due_this_week()
-        by_priority = repo.count_by_priority()
-        by_project = repo.count_by_project()
-        active = repo.list_active()
-
-        # due_today includes overdue — separate them
-        today_only = [r for r in due_today if r.id not in {o.id for o in overdue}]
+        return self._summarize(self._repo.list_active_with_windows())
+
+    @staticmethod
+    def _summarize(rows: list[tuple[Reminder, bool, bool, bool, bool]]) -> dict:
+        """Fold list_active_with_windows rows into the summary counts."""
+        overdue = [r for r, is_overdue, _, _, _ in rows if is_overdue]
+        # The "today" window includes overdue reminders — separate them
+        today_only = [r for r, is_overdue, _, today, _ in rows if today and not is_overdue]
+        by_priority: dict[str, int] = {}
+        by_project: dict[str, int] = {}
+        for r, *_ in rows:
+            by_priority[r.priority.value] = by_priority.get(r.priority.value, 0) + 1
+            if r.project_context is not None:
+                by_project[r.project_context] = by_project.get(r.project_context, 0) + 1
 
         return {
-            "total_active": len(active),
+            "total_active": len(rows),
             "overdue_count": len(overdue),
             "overdue": overdue,
             "due_today_count": len(today_only),
             "due_today": today_only,
-            "due_this_week_count": len(due_this_week),
+            "due_this_week_count": sum(1 for *_, week in rows if week),
             "by_priority": by_priority,
             "by_project": by_project,
         }
@@ -1,18 +1,32 @@
 """Scheduler service for running background reminders."""
 
+import os
 import re
 import signal
-import subprocess
 import sys
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 from remind_database import DatabaseConfig, DatabaseSession
 from remind_cli import output
-from remind_cli.notifications import NotificationManager
 from remind_cli.services.reminder_service import ReminderService
 
+AGENT_PREFIX = "[AGENT:"
 AGENT_PATTERN = re.compile(r"^\[AGENT:(.+?)\]\s*(.+)$")
+AGENT_TIMEOUT_SECONDS = 3600
+_AGENT_POLL_SECONDS = 5  # how often a running agent checks for scheduler shutdown
+
+
+def _watched_db_files(config: DatabaseConfig) -> tuple[str, ...]:
+    """The on-disk SQLite file and its WAL; their mtimes change on every commit."""
+    if not config.is_sqlite():
+        return ()
+    path = config.url.replace("sqlite:///", "")
+    if path == ":memory:":
+        return ()
+    return (path, f"{path}-wal")
 
 
 class SchedulerRunner:
@@ -23,12 +37,24 @@ class SchedulerRunner:
         # Initialize database
         db_config = DatabaseConfig()
         self.db_session = DatabaseSession(db_config)
+        # Stat-ed between checks so reminders added by other processes wake the loop
+        self._watched_files = _watched_db_files(db_config)
+        # Imported here: notification backends are only needed by the daemon
+        from remind_cli.notifications import NotificationManager
+
         self.notifications = NotificationManager(strict=False)
         self.running = False
-        self.check_interval_seconds = 1
+        self.check_interval_seconds = 1  # shortest sleep between checks
+        self.max_sleep_seconds = 60  # longest, when nothing else changes the database
+        self._wake = threading.Event()
+        self._next_event: datetime | None = None  # next due time seen by the last check
+        self._next_nudge: datetime | None = None  # earliest possible nudge, UTC
         self.nudge_intervals_minutes = [30, 60, 120]  # 30min, 1hr, 2hr
-        self.notified_ids: set[int] = set()  # reminders already notified
-        self.last_nudge_times: dict[int, datetime] = {}
+        self.nudge_intervals_seconds = [m * 60 for m in self.nudge_intervals_minutes]
+        self._utc = timezone.utc
+        # Agent tasks run here so a long task never holds up the check loop
+        self._agent_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="remind-agent")
+        self._stopping = threading.Event()
 
     def start(self) -> None:
         """Start the scheduler daemon."""
@@ -38,12 +64,15 @@ class SchedulerRunner:
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
 
-        output.info(f"Scheduler started. Checking every {self.check_interval_seconds}s")
+        output.info(
+            f"Scheduler started. Checking every {self.check_interval_seconds}"
+            f"-{self.max_sleep_seconds}s"
+        )
 
         try:
             while self.running:
                 self._check_and_notify()
-                time.sleep(self.check_interval_seconds)
+                self._wait_for_next_check()
         except KeyboardInterrupt:
             self._shutdown()
 
@@ -51,11 +80,48 @@ class SchedulerRunner:
         """Handle shutdown signals gracefully."""
         output.info("Shutting down scheduler...")
         self.running = False
+        self._wake.set()
         self._shutdown()
         sys.exit(0)
 
+    def _db_stamp(self) -> tuple[int, ...]:
+        """mtimes of the watched database files, 0 for a missing one."""
+        stamps = []
+        for path in self._watched_files:
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(0)
+        return tuple(stamps)
+
+    def _wait_for_next_check(self) -> None:
+        """Sleep until the next due reminder or nudge, or until the database changes."""
+        stamp = self._db_stamp()
+        deadline = time.monotonic() + self._sleep_seconds()
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._wake.wait(min(remaining, self.check_interval_seconds)):
+                return
+            if self._db_stamp() != stamp:
+                return
+
+    def _sleep_seconds(self) -> float:
+        """Time to sleep until the next due reminder or nudge, within bounds."""
+        if not self._watched_files:
+            # No file to watch for other writers: keep polling at the short interval
+            return float(self.check_interval_seconds)
+        delay = float(self.max_sleep_seconds)
+        if self._next_event is not None:
+            delay = min(delay, (self._next_event - datetime.now()).total_seconds())
+        if self._next_nudge is not None:
+            delay = min(delay, (self._next_nudge - datetime.now(self._utc)).total_seconds())
+        return max(float(self.check_interval_seconds), delay)
+
     def _shutdown(self) -> None:
         """Clean shutdown."""
+        # Running agents see this and kill their subprocess
+        self._stopping.set()
+        self._agent_pool.shutdown(wait=False, cancel_futures=True)
         try:
             self.db_session.close()
         except Exception:
@@ -64,41 +130,55 @@ class SchedulerRunner:
     def _check_and_notify(self) -> None:
         """Check for due reminders and send notifications."""
         try:
-            now = datetime.now(timezone.utc)
+            now = datetime.now(self._utc)
+            # Scheduler state is stored as naive UTC
+            stamp = now.replace(tzinfo=None)
+            min_gap = timedelta(seconds=min(self.nudge_intervals_seconds))
 
             with self.db_session.get_session() as session:
                 reminder_service = ReminderService(session)
 
-                # Get overdue reminders (only notify once per reminder)
-                overdue = reminder_service.get_overdue_reminders()
-                for reminder in overdue:
-                    if reminder.id not in self.notified_ids:
-                        self._send_notification(reminder)
-                        self.notified_ids.add(reminder.id)
-
-                # Get upcoming reminders (due within 24 hours but not yet due)
-                upcoming = reminder_service.get_upcoming_reminders()
-                for reminder in upcoming:
-                    # Send nudges if premium
-                    if self._should_nudge(reminder.id, reminder.due_at):
-                        self._send_nudge(reminder)
-                        self.last_nudge_times[reminder.id] = now
+                # Overdue reminders not yet notified (only notify once per reminder)
+                overdue = reminder_service.get_unnotified_overdue_reminders()
+
+                # Upcoming reminders (due within 24 hours but not yet due),
+                # leaving out ones nudged too recently to be nudged again
+                upcoming = reminder_service.get_nudge_candidates(nudged_before=stamp - min_gap)
+
+                self._next_event = reminder_service.get_next_due_at()
+
+            # Notify with the session closed, so slow notifiers don't hold it open
+            for reminder in overdue:
+                self._send_notification(reminder)
+
+            nudged = []
+            for reminder, last_nudge, count in upcoming:
+                # Send nudges if premium
+                if last_nudge is not None:
+                    last_nudge = last_nudge.replace(tzinfo=self._utc)
+                if self._should_nudge(reminder.due_at, last_nudge, count, now):
+                    self._send_nudge(reminder)
+                    nudged.append(reminder.id)
+
+            with self.db_session.get_session() as session:
+                reminder_service = ReminderService(session)
+                reminder_service.mark_notified([r.id for r in overdue], stamp)
+                reminder_service.record_nudges(nudged, stamp)
+                last_nudges = reminder_service.get_last_nudges()
+            self._next_nudge = min(
+                (self._next_nudge_after(last, count) for last, count in last_nudges),
+                default=None,
+            )
 
         except Exception as e:
             output.error(f"Error in scheduler check: {e}")
 
     def _send_notification(self, reminder) -> None:
         """Send initial notification for a due reminder, or execute agent task."""
-        match = AGENT_PATTERN.match(reminder.text)
+        # Cheap prefix test first: almost no reminders are agent tasks
+        match = reminder.text.startswith(AGENT_PREFIX) and AGENT_PATTERN.match(reminder.text)
         if match:
-            self._execute_agent_task(reminder, match.group(1), match.group(2))
-            # Mark as done after execution (regardless of success/failure)
-            with self.db_session.get_session() as session:
-                service = ReminderService(session)
-                try:
-                    service.mark_reminder_done(reminder.id)
-                except Exception:
-                    pass  # Best effort
+            self._agent_pool.submit(self._run_agent_task, reminder, match.group(1), match.group(2))
             return
 
         try:
@@ -109,35 +189,62 @@ class SchedulerRunner:
         except Exception as e:
             output.error(f"Error sending notification: {e}")
 
+    def _run_agent_task(self, reminder, cwd: str, task: str) -> None:
+        """Run an agent task on the worker pool, then mark its reminder done."""
+        self._execute_agent_task(reminder, cwd, task)
+        # Mark as done after execution (regardless of success/failure)
+        try:
+            with self.db_session.get_session() as session:
+                ReminderService(session).mark_reminder_done(reminder.id)
+        except Exception:
+            pass  # Best effort
+
     def _execute_agent_task(self, reminder, cwd: str, task: str) -> None:
         """Execute a Claude Code agent task."""
+        import subprocess
+
         output.info(f"Executing agent task #{reminder.id}: {task} (in {cwd})")
         try:
             self.notifications.notify_reminder_due(
                 f"Agent starting: {task}",
                 sound=True,
             )
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 ["claude", "-p", task, "--dangerously-skip-permissions"],
                 cwd=cwd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=3600,  # 1 hour timeout
             )
-            if result.returncode == 0:
+            deadline = time.monotonic() + AGENT_TIMEOUT_SECONDS
+            # Wait in short slices so a scheduler shutdown isn't stuck behind the agent
+            while True:
+                try:
+                    _, stderr = proc.communicate(timeout=_AGENT_POLL_SECONDS)
+                    break
+                except subprocess.TimeoutExpired:
+                    if self._stopping.is_set():
+                        proc.kill()
+                        proc.communicate()
+                        return
+                    if time.monotonic() > deadline:
+                        proc.kill()
+                        proc.communicate()
+                        raise
+            if proc.returncode == 0:
                 output.info(f"Agent task #{reminder.id} completed successfully")
                 self.notifications.notify_reminder_due(
                     f"Agent completed: {task}",
                     sound=True,
                 )
             else:
-                output.error(f"Agent task #{reminder.id} failed: {result.stderr[:200]}")
+                output.error(f"Agent task #{reminder.id} failed: {stderr[:200]}")
                 self.notifications.notify_reminder_due(
                     f"Agent failed: {task}",
                     sound=True,
                 )
         except subprocess.TimeoutExpired:
-            output.error(f"Agent task #{reminder.id} timed out after 10 minutes")
+            output.error(f"Agent task #{reminder.id} timed out after {AGENT_TIMEOUT_SECONDS // 60} minutes")
             self.notifications.notify_reminder_due(
                 f"Agent timed out: {task}",
                 sound=True,
@@ -157,32 +264,38 @@ class SchedulerRunner:
         except Exception as e:
             output.error(f"Error sending nudge: {e}")
 
-    def _should_nudge(self, reminder_id: int, due_at: datetime) -> bool:
+    def _next_nudge_after(self, last_nudge: datetime, count: int) -> datetime:
+        """When a reminder last nudged at `last_nudge` (naive UTC) is next due a nudge."""
+        intervals = self.nudge_intervals_seconds
+        gap = timedelta(seconds=intervals[min(count, len(intervals) - 1)])
+        return last_nudge.replace(tzinfo=self._utc) + gap
+
+    def _should_nudge(
+        self, due_at: datetime, last_nudge: datetime | None, count: int, now: datetime
+    ) -> bool:
         """Check if a reminder should be nudged.
 
+        Args:
+            due_at: The reminder's due time
+            last_nudge: When it was last nudged (UTC), or None if never
+            count: How many nudges it has had
+            now: Current UTC time, taken once per scheduler check
+
         Returns:
             True if enough time has passed since last nudge
         """
-        now = datetime.now(timezone.utc)
-
         # Ensure due_at is timezone-aware (SQLite might return naive datetimes)
         if due_at.tzinfo is None:
-            due_at = due_at.replace(tzinfo=timezone.utc)
+            due_at = due_at.replace(tzinfo=self._utc)
 
         # First nudge: reminder hasn't been nudged yet but is overdue
-        if reminder_id not in self.last_nudge_times:
-            time_since_due_minutes = (now - due_at).total_seconds() / 60
-            return time_since_due_minutes > self.nudge_intervals_minutes[0]
-
-        last_nudge = self.last_nudge_times[reminder_id]
-        time_since_nudge = (now - last_nudge).total_seconds() / 60
-
-        # Check if next nudge interval has passed
-        for interval in self.nudge_intervals_minutes:
-            if time_since_nudge > interval:
-                return True
+        if last_nudge is None:
+            return (now - due_at).total_seconds() > self.nudge_intervals_seconds[0]
 
-        return False
+        # Each nudge waits for the next interval in turn; the last one repeats
+        intervals = self.nudge_intervals_seconds
+        next_interval = intervals[min(count, len(intervals) - 1)]
+        return (now - last_nudge).total_seconds() > next_interval
 
 
 def run_scheduler() -> None:
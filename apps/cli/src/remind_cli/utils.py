@@ -1,8 +1,11 @@
 """Utility functions shared across Remind modules."""
 
+import socket
 import subprocess
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from remind_shared.models import PriorityLevel
 from remind_cli.platform_utils import get_platform
@@ -139,3 +142,20 @@ def format_datetime(dt: datetime) -> str:
 
     # Far future - show the date
     return dt.strftime("%b %d at %I:%M %p").lstrip("0")
+
+
+def prefetch_dns(url: str) -> None:
+    """Resolve the URL's host on a daemon thread to warm the resolver cache.
+
+    Best effort: malformed URLs are ignored and left for the real request to report.
+    """
+    try:
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+    except ValueError:
+        return
+    if not parts.hostname:
+        return
+    threading.Thread(
+        target=socket.getaddrinfo, args=(parts.hostname, port), daemon=True
+    ).start()
@@ -5,20 +5,24 @@ Non-blocking: never delays CLI execution on network failure.
 """
 
 import json
+import re
 import time
+from functools import lru_cache
 from pathlib import Path
 
-import httpx
-
 from remind_cli import __version__
 
 _CACHE_FILE = Path.home() / ".remind" / "version_check.json"
 _CHECK_INTERVAL = 86400  # 24 hours
 _PYPI_URL = "https://pypi.org/pypi/remind-cli/json"
+_VERSION_RE = re.compile(r"v?(\d+)(?:\.(\d+))?(?:\.(\d+))?")
 
 
-def _read_cache() -> dict:
+def _read_cache(now: float) -> dict:
+    """Read the cache, skipping the parse when its mtime already shows it's stale."""
     try:
+        if now - _CACHE_FILE.stat().st_mtime >= _CHECK_INTERVAL:
+            return {}
         return json.loads(_CACHE_FILE.read_text())
     except Exception:
         return {}
@@ -32,12 +36,20 @@ def _write_cache(data: dict) -> None:
         pass
 
 
+@lru_cache(maxsize=16)
 def _parse_version(v: str) -> tuple[int, ...]:
-    """Parse '1.2.3' into (1, 2, 3) for comparison."""
-    try:
-        return tuple(int(x) for x in v.strip().split("."))
-    except Exception:
+    """Parse '1.2.3' into (1, 2, 3) for comparison.
+
+    Only the leading release numbers count, so PEP 440 suffixes such as
+    '1.2.3rc1' or '1.2.3.post1' compare as their release, not as (0,).
+    """
+    match = _VERSION_RE.match(v.strip())
+    if not match:
         return (0,)
+    return tuple(int(x or 0) for x in match.groups())
+
+
+_CURRENT_VERSION = _parse_version(__version__)
 
 
 def get_update_notice() -> str | None:
@@ -45,28 +57,30 @@ def get_update_notice() -> str | None:
 
     Checks PyPI at most once per day. Returns immediately on any failure.
     """
-    cache = _read_cache()
     now = time.time()
+    cache = _read_cache(now)
 
     # Use cached result if fresh enough
     if now - cache.get("checked_at", 0) < _CHECK_INTERVAL:
         latest = cache.get("latest_version")
-        if latest and _parse_version(latest) > _parse_version(__version__):
+        if latest and _parse_version(latest) > _CURRENT_VERSION:
             return f"Update available: {__version__} → {latest}  (run: remind update)"
         return None
 
     # Fetch from PyPI (short timeout — never block the CLI)
+    # urllib rather than httpx: this runs on CLI startup and httpx is slow to import
     try:
-        with httpx.Client(timeout=3.0) as client:
-            resp = client.get(_PYPI_URL)
-            if resp.status_code != 200:
+        from urllib.request import urlopen
+
+        with urlopen(_PYPI_URL, timeout=3.0) as resp:
+            if resp.status != 200:
                 return None
-            latest = resp.json()["info"]["version"]
+            latest = json.load(resp)["info"]["version"]
     except Exception:
         return None
 
     _write_cache({"latest_version": latest, "checked_at": now})
 
-    if _parse_version(latest) > _parse_version(__version__):
+    if _parse_version(latest) > _CURRENT_VERSION:
         return f"Update available: {__version__} → {latest}  (run: remind update)"
     return None
@@ -1,25 +1,86 @@
 """Pytest configuration and fixtures for CLI tests."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from remind_database.models import Base, ReminderModel
+# SQLAlchemy and the models are imported inside the fixtures: they dominate
+# import time, and collection alone (--collect-only, IDE discovery) needs neither.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def fixed_now():
+    """A fixed instant safely in the future, for tests that don't want the wall clock."""
+    return datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="session")
 def test_db_engine():
-    """Create an in-memory SQLite database for testing."""
+    """Create an in-memory SQLite database, with the schema built once per run.
+
+    Each pytest-xdist worker is its own process, so workers never share it.
+    """
+    from sqlalchemy import create_engine, event
+
+    from remind_database.models import Base
+
     engine = create_engine("sqlite:///:memory:", echo=False)
+
+    # pysqlite manages transactions itself and breaks SAVEPOINTs; let
+    # SQLAlchemy emit BEGIN so commits inside tests become savepoint releases
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
     yield engine
     Base.metadata.drop_all(engine)
+    engine.dispose()
 
 
 @pytest.fixture
-def test_session(test_db_engine):
-    """Create a test database session."""
-    SessionLocal = sessionmaker(bind=test_db_engine)
-    session = SessionLocal()
+def db_connection(test_db_engine):
+    """Connection inside an outer transaction that is rolled back after the test."""
+    connection = test_db_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def test_session(db_connection):
+    """Create a test database session whose work is rolled back afterwards."""
+    from sqlalchemy.orm import Session
+
+    session = Session(bind=db_connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
+
+
+@pytest.fixture
+def seed(test_session):
+    """Bulk-insert reminders, bypassing the service, and return their ids.
+
+    ``seed(3)`` adds "Task 1".."Task 3" due tomorrow; ``texts`` overrides the
+    names and any other keyword sets that column on every row.
+    """
+    from sqlalchemy import insert
+
+    from remind_database.models import ReminderModel
+
+    def _seed(n: int | None = None, texts: list[str] | None = None, **columns) -> list[int]:
+        if texts is None:
+            texts = [f"Task {i}" for i in range(1, n + 1)]
+        defaults = {"due_at": datetime.now() + timedelta(days=1), "priority": "medium"}
+        rows = [{**defaults, **columns, "text": text} for text in texts]
+        stmt = insert(ReminderModel).returning(ReminderModel.id, sort_by_parameter_order=True)
+        ids = list(test_session.scalars(stmt, rows))
+        test_session.commit()
+        return ids
+
+    return _seed
@@ -1,84 +1,146 @@
-"""Integration tests for CLI commands - tests actual command execution."""
+"""Integration tests for CLI commands - tests actual command execution.
 
-from datetime import datetime, timedelta, timezone
-from pathlib import Path
-import tempfile
+The CLI and database packages are imported inside fixtures and tests, so
+collecting this module stays cheap.
+"""
+
+import io
+import json
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from functools import cache
+from typing import NamedTuple
 
 import pytest
-from click.testing import CliRunner
-from typer.testing import CliRunner as TyperCliRunner
 
-from remind_database import DatabaseConfig, DatabaseSession
-from remind_shared import PriorityLevel
-from remind_cli.cli import app
-from remind_cli.services.reminder_service import ReminderService
+
+@pytest.fixture(scope="module")
+def _db_singleton():
+    """Claim the DatabaseSession singleton so commands never open ~/.remind."""
+    from remind_database import DatabaseSession
+
+    DatabaseSession.reset()
+    yield DatabaseSession()
+    DatabaseSession.reset()
 
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        config = DatabaseConfig(db_path=db_path)
-        session = DatabaseSession(config)
-        yield session
-        session.close()
-        DatabaseSession.reset()
+def temp_db(_db_singleton, db_connection):
+    """Route the CLI's database sessions into a transaction rolled back after the test."""
+    from remind_database import DatabaseSession
+
+    with DatabaseSession.bind(db_connection):
+        yield _db_singleton
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """One CLI runner for the run; it holds no per-test state.
+
+    Its results capture stderr separately from stdout.
+    """
+    from typer.testing import CliRunner
+
+    return CliRunner()
+
+
+@cache
+def _app():
+    """The Typer app and its Click command, imported on first use."""
+    import typer
+
+    from remind_cli.cli import app
+
+    return app, typer.main.get_command(app)
+
+
+class CliResult(NamedTuple):
+    exit_code: int
+    stdout: str
+
+
+def run_cli(args: list[str]) -> CliResult:
+    """Run the CLI in-process, capturing stdout.
+
+    Lighter than CliRunner.invoke; use the runner where stream isolation matters.
+    """
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            rv = _app()[1].main(args=args, prog_name="remind", standalone_mode=False)
+        code = rv if isinstance(rv, int) else 0
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    except Exception as exc:
+        # Click usage errors carry their exit code
+        if not hasattr(exc, "exit_code"):
+            raise
+        code = exc.exit_code
+    return CliResult(code, buf.getvalue())
 
 
 @pytest.fixture
-def cli_runner(temp_db):
-    """Create a CLI runner with temporary database."""
-    return TyperCliRunner()
+def svc(test_session, temp_db):
+    """Reminder service on the same rolled-back connection the CLI uses.
+
+    Seeding data through it skips a full CLI invocation per reminder.
+    """
+    from remind_cli.services.reminder_service import ReminderService
+
+    return ReminderService(test_session)
+
+
+def _tomorrow() -> datetime:
+    return datetime.now() + timedelta(days=1)
 
 
 class TestAddCommand:
     """Integration tests for add command."""
 
-    def test_add_basic_reminder(self, cli_runner, temp_db):
+    def test_add_basic_reminder(self, temp_db):
         """Test adding a basic reminder."""
-        result = cli_runner.invoke(app, ["add", "Buy groceries"])
+        result = run_cli(["add", "Buy groceries"])
         assert result.exit_code == 0
         assert "Reminder saved" in result.stdout
         assert "Buy groceries" in result.stdout
 
-    def test_add_with_due_date(self, cli_runner, temp_db):
+    def test_add_with_due_date(self, temp_db):
         """Test adding reminder with due date."""
-        result = cli_runner.invoke(
-            app, ["add", "Call mom", "--due", "tomorrow 5pm"]
+        result = run_cli(
+            ["add", "Call mom", "--due", "tomorrow 5pm"]
         )
         assert result.exit_code == 0
         assert "Reminder saved" in result.stdout
 
-    def test_add_with_priority(self, cli_runner, temp_db):
+    def test_add_with_priority(self, temp_db):
         """Test adding reminder with priority."""
-        result = cli_runner.invoke(
-            app, ["add", "Urgent task", "--priority", "high"]
+        result = run_cli(
+            ["add", "Urgent task", "--priority", "high"]
         )
         assert result.exit_code == 0
         assert "Reminder saved" in result.stdout
         assert "HIGH" in result.stdout
 
-    def test_add_with_project(self, cli_runner, temp_db):
+    def test_add_with_project(self, temp_db):
         """Test adding reminder with project context."""
-        result = cli_runner.invoke(
-            app, ["add", "Review PR", "--project", "work"]
+        result = run_cli(
+            ["add", "Review PR", "--project", "work"]
         )
         assert result.exit_code == 0
         assert "Reminder saved" in result.stdout
 
-    def test_add_multiple_reminders(self, cli_runner, temp_db):
+    def test_add_multiple_reminders(self, temp_db):
         """Test adding multiple reminders."""
-        result1 = cli_runner.invoke(app, ["add", "Task 1"])
-        result2 = cli_runner.invoke(app, ["add", "Task 2"])
-        result3 = cli_runner.invoke(app, ["add", "Task 3"])
+        result1 = run_cli(["add", "Task 1"])
+        result2 = run_cli(["add", "Task 2"])
+        result3 = run_cli(["add", "Task 3"])
 
         assert result1.exit_code == 0
         assert result2.exit_code == 0
         assert result3.exit_code == 0
 
         # Verify all were added
-        list_result = cli_runner.invoke(app, ["list"])
+        list_result = run_cli(["list"])
         assert "Task 1" in list_result.stdout
         assert "Task 2" in list_result.stdout
         assert "Task 3" in list_result.stdout
@@ -87,173 +149,172 @@ class TestAddCommand:
     def test_add_invalid_priority(self, cli_runner, temp_db):
         """Test adding reminder with invalid priority."""
         result = cli_runner.invoke(
-            app, ["add", "Task", "--priority", "urgent"]
+            _app()[0], ["add", "Task", "--priority", "urgent"]
         )
-        assert result.exit_code != 0
-        # Error is printed to stderr but captured separately by test runner
         assert result.exit_code == 1
+        assert "Invalid priority" in result.stderr
 
 
 class TestListCommand:
     """Integration tests for list command."""
 
-    def test_list_empty(self, cli_runner, temp_db):
+    def test_list_empty(self, temp_db):
         """Test list when no reminders exist."""
-        result = cli_runner.invoke(app, ["list"])
+        result = run_cli(["list"])
         assert result.exit_code == 0
         assert "No reminders found" in result.stdout
 
-    def test_list_active_reminders(self, cli_runner, temp_db):
+    def test_list_active_reminders(self, svc):
         """Test listing active reminders."""
-        # Add reminders
-        cli_runner.invoke(app, ["add", "Active 1"])
-        cli_runner.invoke(app, ["add", "Active 2"])
+        svc.create_reminder(text="Active 1", due_at=_tomorrow())
+        svc.create_reminder(text="Active 2", due_at=_tomorrow())
 
-        result = cli_runner.invoke(app, ["list"])
+        result = run_cli(["list"])
         assert result.exit_code == 0
         assert "Active 1" in result.stdout
         assert "Active 2" in result.stdout
         assert "2 reminder" in result.stdout
 
-    def test_list_all_reminders(self, cli_runner, temp_db):
-        """Test listing all reminders including done ones."""
-        # Add and mark done
-        cli_runner.invoke(app, ["add", "Active"])
-        cli_runner.invoke(app, ["add", "Done task"])
-        cli_runner.invoke(app, ["done", "2"])
-
-        # List active only
-        active_result = cli_runner.invoke(app, ["list"])
-        assert "Active" in active_result.stdout
-        assert "Done task" not in active_result.stdout
-
-        # List all
-        all_result = cli_runner.invoke(app, ["list", "--all"])
-        assert "Active" in all_result.stdout
-        assert "Done task" in all_result.stdout
+    @pytest.mark.parametrize(
+        "args,hits,misses",
+        [
+            (["list"], ["Active"], ["Done task"]),
+            (["list", "--all"], ["Active", "Done task"], []),
+        ],
+    )
+    def test_list_all_reminders(self, svc, args, hits, misses):
+        """Test done reminders are listed only with --all."""
+        svc.create_reminder(text="Active", due_at=_tomorrow())
+        done = svc.create_reminder(text="Done task", due_at=_tomorrow())
+        svc.mark_reminder_done(done.id)
+
+        result = run_cli(args)
+        assert result.exit_code == 0
+        assert all(text in result.stdout for text in hits)
+        assert not any(text in result.stdout for text in misses)
 
-    def test_list_json_output(self, cli_runner, temp_db):
+    def test_list_json_output(self, svc):
         """Test list with JSON output."""
-        cli_runner.invoke(app, ["add", "JSON test"])
+        # Longer than the console width: the JSON must not be soft-wrapped
+        svc.create_reminder(text="JSON test " + "x" * 200, due_at=_tomorrow())
 
-        result = cli_runner.invoke(app, ["list", "--json"])
+        result = run_cli(["list", "--json"])
         assert result.exit_code == 0
-        assert '"id"' in result.stdout
-        assert '"text"' in result.stdout
-        assert '"due_at"' in result.stdout
-        assert '"priority"' in result.stdout
+        data = json.loads(result.stdout)
+        assert isinstance(data, list) and data
+        assert {"id", "text", "due_at", "priority"} <= data[0].keys()
+        assert data[0]["text"] == "JSON test " + "x" * 200
 
-    def test_list_by_priority(self, cli_runner, temp_db):
+    @pytest.mark.parametrize("priority", ["high", "medium", "low"])
+    def test_list_by_priority(self, svc, priority):
         """Test filtering list by priority."""
-        cli_runner.invoke(app, ["add", "High priority", "--priority", "high"])
-        cli_runner.invoke(app, ["add", "Medium priority"])
-        cli_runner.invoke(app, ["add", "Low priority", "--priority", "low"])
+        from remind_shared import PriorityLevel
 
-        result = cli_runner.invoke(app, ["list", "--priority", "high"])
+        for level in PriorityLevel:
+            svc.create_reminder(
+                text=f"{level.value.title()} priority", due_at=_tomorrow(), priority=level
+            )
+
+        result = run_cli(["list", "--priority", priority])
         assert result.exit_code == 0
-        assert "High priority" in result.stdout
-        assert "Medium priority" not in result.stdout
-        assert "Low priority" not in result.stdout
+        for level in PriorityLevel:
+            shown = f"{level.value.title()} priority" in result.stdout
+            assert shown == (level.value == priority)
 
 
 class TestDoneCommand:
     """Integration tests for done command."""
 
-    def test_mark_done(self, cli_runner, temp_db):
+    def test_mark_done(self, temp_db):
         """Test marking a reminder as done."""
-        cli_runner.invoke(app, ["add", "Complete me"])
+        run_cli(["add", "Complete me"])
 
-        result = cli_runner.invoke(app, ["done", "1"])
+        result = run_cli(["done", "1"])
         assert result.exit_code == 0
         assert "Done: Complete me" in result.stdout
 
-    def test_mark_done_removes_from_active(self, cli_runner, temp_db):
+    def test_mark_done_removes_from_active(self, temp_db):
         """Test that done reminder disappears from active list."""
-        cli_runner.invoke(app, ["add", "Task"])
+        run_cli(["add", "Task"])
 
         # Mark done
-        cli_runner.invoke(app, ["done", "1"])
+        run_cli(["done", "1"])
 
         # Check not in active list
-        result = cli_runner.invoke(app, ["list"])
+        result = run_cli(["list"])
         assert "Task" not in result.stdout
         assert "No reminders found" in result.stdout
 
     def test_mark_done_nonexistent(self, cli_runner, temp_db):
         """Test marking nonexistent reminder as done."""
-        result = cli_runner.invoke(app, ["done", "999"])
-        assert result.exit_code != 0
-        # Error is printed to stderr but captured separately by test runner
+        result = cli_runner.invoke(_app()[0], ["done", "999"])
         assert result.exit_code == 1
+        assert "not found" in result.stderr
 
-    def test_mark_done_multiple_times(self, cli_runner, temp_db):
+    def test_mark_done_multiple_times(self, svc):
         """Test marking multiple reminders as done."""
-        cli_runner.invoke(app, ["add", "Task 1"])
-        cli_runner.invoke(app, ["add", "Task 2"])
-        cli_runner.invoke(app, ["add", "Task 3"])
+        task1, task2, _ = (
+            svc.create_reminder(text=f"Task {i}", due_at=_tomorrow()) for i in range(1, 4)
+        )
 
-        cli_runner.invoke(app, ["done", "1"])
-        cli_runner.invoke(app, ["done", "2"])
+        assert run_cli(["done", str(task1.id)]).exit_code == 0
+        assert run_cli(["done", str(task2.id)]).exit_code == 0
 
-        result = cli_runner.invoke(app, ["list"])
-        assert "Task 1" not in result.stdout
-        assert "Task 2" not in result.stdout
-        assert "Task 3" in result.stdout
+        assert [r.text for r in svc.list_active_reminders()] == ["Task 3"]
 
 
 class TestSearchCommand:
     """Integration tests for search command."""
 
-    def test_search_finds_reminders(self, cli_runner, temp_db):
-        """Test searching for reminders."""
-        cli_runner.invoke(app, ["add", "Buy groceries"])
-        cli_runner.invoke(app, ["add", "Buy milk"])
-        cli_runner.invoke(app, ["add", "Call mom"])
-
-        result = cli_runner.invoke(app, ["search", "buy"])
-        assert result.exit_code == 0
-        assert "Buy groceries" in result.stdout
-        assert "Buy milk" in result.stdout
-        assert "Call mom" not in result.stdout
-
-    def test_search_case_insensitive(self, cli_runner, temp_db):
-        """Test that search is case-insensitive."""
-        cli_runner.invoke(app, ["add", "IMPORTANT TASK"])
-
-        result = cli_runner.invoke(app, ["search", "important"])
-        assert result.exit_code == 0
-        assert "IMPORTANT TASK" in result.stdout
-
-    def test_search_no_results(self, cli_runner, temp_db):
-        """Test search with no results."""
-        cli_runner.invoke(app, ["add", "Task"])
-
-        result = cli_runner.invoke(app, ["search", "nonexistent"])
+    @pytest.mark.parametrize(
+        "seeds,query,hits,misses",
+        [
+            (
+                ["Buy groceries", "Buy milk", "Call mom"],
+                "buy",
+                ["Buy groceries", "Buy milk"],
+                ["Call mom"],
+            ),
+            (["IMPORTANT TASK"], "important", ["IMPORTANT TASK"], []),
+            (["Task"], "nonexistent", [], ["Task"]),
+        ],
+        ids=["finds", "case-insensitive", "no-results"],
+    )
+    def test_search(self, svc, seeds, query, hits, misses):
+        """Test search output for a set of seeded reminders."""
+        for text in seeds:
+            svc.create_reminder(text=text, due_at=_tomorrow())
+
+        result = run_cli(["search", query])
         assert result.exit_code == 0
-        assert "No reminders matching" in result.stdout
+        assert all(text in result.stdout for text in hits)
+        assert not any(text in result.stdout for text in misses)
+        if not hits:
+            assert "No reminders matching" in result.stdout
 
-    def test_search_json_output(self, cli_runner, temp_db):
+    def test_search_json_output(self, svc):
         """Test search with JSON output."""
-        cli_runner.invoke(app, ["add", "Search test"])
+        svc.create_reminder(text="Search test", due_at=_tomorrow())
 
-        result = cli_runner.invoke(app, ["search", "search", "--json"])
+        result = run_cli(["search", "search", "--json"])
         assert result.exit_code == 0
-        assert '"id"' in result.stdout
-        assert '"text"' in result.stdout
+        data = json.loads(result.stdout)
+        assert isinstance(data, list) and data
+        assert {"id", "text"} <= data[0].keys()
 
 
 class TestSchedulerCommand:
     """Integration tests for scheduler command."""
 
-    def test_scheduler_status(self, cli_runner, temp_db):
+    def test_scheduler_status(self, temp_db):
         """Test checking scheduler status."""
-        result = cli_runner.invoke(app, ["scheduler", "--status"])
+        result = run_cli(["scheduler", "--status"])
         assert result.exit_code == 0
         assert "SCHEDULER STATUS" in result.stdout
 
-    def test_scheduler_help(self, cli_runner, temp_db):
+    def test_scheduler_help(self, temp_db):
         """Test scheduler help."""
-        result = cli_runner.invoke(app, ["scheduler", "--help"])
+        result = run_cli(["scheduler", "--help"])
         assert result.exit_code == 0
         assert "--enable" in result.stdout
         assert "--disable" in result.stdout
@@ -263,81 +324,85 @@ class TestSchedulerCommand:
 class TestCompleteWorkflow:
     """Integration tests for complete workflows."""
 
-    def test_add_list_search_done_workflow(self, cli_runner, temp_db):
+    def test_add_list_search_done_workflow(self, svc):
         """Test complete workflow: add → list → search → done."""
-        # Add reminders
-        add1 = cli_runner.invoke(app, ["add", "Buy groceries", "--priority", "high"])
-        add2 = cli_runner.invoke(app, ["add", "Call mom", "--priority", "medium"])
-        add3 = cli_runner.invoke(app, ["add", "Review PR", "--project", "work"])
+        from remind_shared import PriorityLevel
 
-        assert add1.exit_code == 0
-        assert add2.exit_code == 0
-        assert add3.exit_code == 0
+        # Add reminders (the add command itself is covered by TestAddCommand)
+        groceries = svc.create_reminder(
+            text="Buy groceries", due_at=_tomorrow(), priority=PriorityLevel.HIGH
+        )
+        svc.create_reminder(text="Call mom", due_at=_tomorrow(), priority=PriorityLevel.MEDIUM)
+        svc.create_reminder(text="Review PR", due_at=_tomorrow(), project_context="work")
 
         # List all
-        list_result = cli_runner.invoke(app, ["list"])
+        list_result = run_cli(["list"])
         assert list_result.exit_code == 0
         assert "3 reminder" in list_result.stdout
 
         # Search
-        search_result = cli_runner.invoke(app, ["search", "buy"])
+        search_result = run_cli(["search", "buy"])
         assert search_result.exit_code == 0
         assert "Buy groceries" in search_result.stdout
         assert "Call mom" not in search_result.stdout
 
         # Mark done
-        done_result = cli_runner.invoke(app, ["done", "1"])
+        done_result = run_cli(["done", str(groceries.id)])
         assert done_result.exit_code == 0
         assert "Done: Buy groceries" in done_result.stdout
 
         # List active (should not include done)
-        final_list = cli_runner.invoke(app, ["list"])
+        final_list = run_cli(["list"])
         assert "Buy groceries" not in final_list.stdout
         assert "Call mom" in final_list.stdout
         assert "Review PR" in final_list.stdout
 
-    def test_multiple_operations_sequence(self, cli_runner, temp_db):
+    def test_multiple_operations_sequence(self, test_session, temp_db, seed):
         """Test sequence of multiple operations."""
+        from sqlalchemy import update
+
+        from remind_database import ReminderModel
+
         # Add 5 reminders
-        for i in range(1, 6):
-            result = cli_runner.invoke(app, ["add", f"Task {i}"])
-            assert result.exit_code == 0
+        ids = seed(5)
 
         # Check count
-        list_result = cli_runner.invoke(app, ["list"])
+        list_result = run_cli(["list"])
         assert "5 reminder" in list_result.stdout
 
         # Mark some done
-        for task_id in [1, 3, 5]:
-            result = cli_runner.invoke(app, ["done", str(task_id)])
-            assert result.exit_code == 0
+        test_session.execute(
+            update(ReminderModel)
+            .where(ReminderModel.id.in_(ids[::2]))
+            .values(done_at=datetime.now())
+        )
+        test_session.commit()
 
         # Check remaining
-        list_result = cli_runner.invoke(app, ["list"])
+        list_result = run_cli(["list"])
         assert "Task 2" in list_result.stdout
         assert "Task 4" in list_result.stdout
         assert "Task 1" not in list_result.stdout
         assert "2 reminder" in list_result.stdout
 
         # Check all includes done
-        all_result = cli_runner.invoke(app, ["list", "--all"])
+        all_result = run_cli(["list", "--all"])
         assert "5 reminder" in all_result.stdout
 
 
 class TestNotificationSystem:
     """Integration tests for end-to-end notification system."""
 
-    def test_scheduler_detects_overdue_reminders(self, temp_db):
+    def test_scheduler_detects_overdue_reminders(self, temp_db, fixed_now):
         """Test that scheduler correctly detects overdue reminders."""
-        from datetime import timezone, timedelta
         from remind_cli.services.reminder_service import ReminderService
+        from remind_shared import PriorityLevel
 
         with temp_db.get_session() as session:
             service = ReminderService(session)
 
             # Create an overdue reminder (1 hour ago)
-            now = datetime.now(timezone.utc)
-            past_due = now - timedelta(hours=1)
+            past_due = fixed_now - timedelta(hours=1)
             reminder = service.create_reminder(
                 text="This reminder is overdue",
                 due_at=past_due,
@@ -347,21 +412,20 @@ class TestNotificationSystem:
             assert reminder is not None
 
             # Verify scheduler can detect it
-            overdue = service.get_overdue_reminders()
+            overdue = service.get_overdue_reminders(now=fixed_now)
             assert len(overdue) == 1
             assert overdue[0].text == "This reminder is overdue"
 
-    def test_scheduler_detects_upcoming_reminders(self, temp_db):
+    def test_scheduler_detects_upcoming_reminders(self, temp_db, fixed_now):
         """Test that scheduler correctly detects upcoming reminders."""
-        from datetime import timezone, timedelta
         from remind_cli.services.reminder_service import ReminderService
+        from remind_shared import PriorityLevel
 
         with temp_db.get_session() as session:
             service = ReminderService(session)
 
             # Create an upcoming reminder (30 minutes from now)
-            now = datetime.now(timezone.utc)
-            upcoming = now + timedelta(minutes=30)
+            upcoming = fixed_now + timedelta(minutes=30)
             reminder = service.create_reminder(
                 text="This reminder is upcoming",
                 due_at=upcoming,
@@ -370,21 +434,20 @@ class TestNotificationSystem:
             assert reminder is not None
 
             # Verify scheduler can detect it as upcoming (within next 24 hours)
-            upcoming_reminders = service.get_upcoming_reminders(hours=24)
+            upcoming_reminders = service.get_upcoming_reminders(hours=24, now=fixed_now)
             assert len(upcoming_reminders) == 1
             assert upcoming_reminders[0].text == "This reminder is upcoming"
 
-    def test_notification_flow_overdue_to_done(self, cli_runner, temp_db):
+    def test_notification_flow_overdue_to_done(self, temp_db, fixed_now):
         """Test complete flow: create overdue → scheduler detects → mark done."""
-        from datetime import timezone, timedelta
         from remind_cli.services.reminder_service import ReminderService
+        from remind_shared import PriorityLevel
 
         with temp_db.get_session() as session:
             service = ReminderService(session)
 
             # Create overdue reminder
-            now = datetime.now(timezone.utc)
-            past_due = now - timedelta(minutes=5)
+            past_due = fixed_now - timedelta(minutes=5)
             service.create_reminder(
                 text="Overdue task to complete",
                 due_at=past_due,
@@ -393,12 +456,12 @@ class TestNotificationSystem:
             )
 
             # Verify scheduler detects it
-            overdue = service.get_overdue_reminders()
+            overdue = service.get_overdue_reminders(now=fixed_now)
             assert len(overdue) == 1
             overdue_id = overdue[0].id
 
             # Mark it done via CLI
-            result = cli_runner.invoke(app, ["done", str(overdue_id)])
+            result = run_cli(["done", str(overdue_id)])
             assert result.exit_code == 0
             assert "Done:" in result.stdout
 
@@ -4,18 +4,23 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from remind_shared import ValidationError, PriorityLevel
-from remind_cli.services.reminder_service import ReminderService
+
+@pytest.fixture
+def service(test_session):
+    """Reminder service on the rolled-back test session."""
+    from remind_cli.services.reminder_service import ReminderService
+
+    return ReminderService(test_session)
 
 
 class TestReminderService:
     """Tests for reminder service."""
 
-    def test_create_reminder(self, test_session):
+    def test_create_reminder(self, service, fixed_now):
         """Test creating a reminder."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-        due_at = now + timedelta(days=1)
+        from remind_shared import PriorityLevel
+
+        due_at = fixed_now + timedelta(days=1)
 
         reminder = service.create_reminder(
             text="Buy groceries",
@@ -28,11 +33,11 @@ class TestReminderService:
         assert reminder.priority == PriorityLevel.MEDIUM
         assert reminder.done_at is None
 
-    def test_create_reminder_invalid_text_too_long(self, test_session):
+    def test_create_reminder_invalid_text_too_long(self, service, fixed_now):
         """Test creating reminder with text exceeding max length."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-        due_at = now + timedelta(days=1)
+        from remind_shared import ValidationError
+
+        due_at = fixed_now + timedelta(days=1)
 
         with pytest.raises(ValidationError, match="too long"):
             service.create_reminder(
@@ -40,9 +45,10 @@ class TestReminderService:
                 due_at=due_at,
             )
 
-    def test_create_reminder_past_date(self, test_session):
+    def test_create_reminder_past_date(self, service):
         """Test creating reminder with past due date."""
-        service = ReminderService(test_session)
+        from remind_shared import ValidationError
+
         now = datetime.now(timezone.utc)
         past_date = now - timedelta(days=1)
 
@@ -52,11 +58,9 @@ class TestReminderService:
                 due_at=past_date,
             )
 
-    def test_get_reminder(self, test_session):
+    def test_get_reminder(self, service, fixed_now):
         """Test getting a reminder by ID."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-        due_at = now + timedelta(days=1)
+        due_at = fixed_now + timedelta(days=1)
 
         created = service.create_reminder(
             text="Test reminder",
@@ -67,40 +71,26 @@ class TestReminderService:
         assert retrieved.id == created.id
         assert retrieved.text == "Test reminder"
 
-    def test_get_reminder_not_found(self, test_session):
+    def test_get_reminder_not_found(self, service):
         """Test getting non-existent reminder."""
-        service = ReminderService(test_session)
+        from remind_shared import ValidationError
 
         with pytest.raises(ValidationError, match="not found"):
             service.get_reminder(999)
 
-    def test_list_active_reminders(self, test_session):
+    def test_list_active_reminders(self, service, seed, fixed_now):
         """Test listing active reminders."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-
-        # Create one reminder
-        service.create_reminder(
-            text="Active reminder",
-            due_at=now + timedelta(days=1),
-        )
-
-        # Create and mark one as done
-        done_reminder = service.create_reminder(
-            text="Done reminder",
-            due_at=now + timedelta(days=1),
-        )
-        service.mark_reminder_done(done_reminder.id)
+        # Rows are inserted directly: this checks listing, not validation
+        seed(texts=["Active reminder"])
+        seed(texts=["Done reminder"], done_at=fixed_now)
 
         active = service.list_active_reminders()
         assert len(active) == 1
         assert active[0].text == "Active reminder"
 
-    def test_mark_reminder_done(self, test_session):
+    def test_mark_reminder_done(self, service, fixed_now):
         """Test marking reminder as complete."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-        due_at = now + timedelta(days=1)
+        due_at = fixed_now + timedelta(days=1)
 
         reminder = service.create_reminder(
             text="Complete me",
@@ -110,26 +100,31 @@ class TestReminderService:
         completed = service.mark_reminder_done(reminder.id)
         assert completed.done_at is not None
 
-    def test_search_reminders(self, test_session):
-        """Test searching reminders by text."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-        due_at = now + timedelta(days=1)
+    def test_bulk_complete(self, service, fixed_now):
+        """Test bulk completion returns only the reminders it completed."""
+        due = fixed_now + timedelta(days=1)
+        first = service.create_reminder(text="First", due_at=due)
+        second = service.create_reminder(text="Second", due_at=due)
+        service.mark_reminder_done(second.id)
+
+        completed = service.bulk_complete([first.id, second.id, 9999])
 
-        service.create_reminder(text="Buy groceries", due_at=due_at)
-        service.create_reminder(text="Buy milk", due_at=due_at)
-        service.create_reminder(text="Call mom", due_at=due_at)
+        assert [r.id for r in completed] == [first.id]
+        assert completed[0].done_at is not None
+        assert service.list_active_reminders() == []
+
+    def test_search_reminders(self, service, seed):
+        """Test searching reminders by text."""
+        seed(texts=["Buy groceries", "Buy milk", "Call mom"])
 
         results = service.search_reminders("buy")
         assert len(results) == 2
         assert any("groceries" in r.text.lower() for r in results)
         assert any("milk" in r.text.lower() for r in results)
 
-    def test_search_reminders_case_insensitive(self, test_session):
+    def test_search_reminders_case_insensitive(self, service, fixed_now):
         """Test search is case-insensitive."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-        due_at = now + timedelta(days=1)
+        due_at = fixed_now + timedelta(days=1)
 
         service.create_reminder(text="IMPORTANT TASK", due_at=due_at)
 
@@ -137,11 +132,11 @@ class TestReminderService:
         assert len(results) == 1
         assert results[0].text == "IMPORTANT TASK"
 
-    def test_delete_reminder(self, test_session):
+    def test_delete_reminder(self, service, fixed_now):
         """Test deleting a reminder."""
-        service = ReminderService(test_session)
-        now = datetime.now(timezone.utc)
-        due_at = now + timedelta(days=1)
+        from remind_shared import ValidationError
+
+        due_at = fixed_now + timedelta(days=1)
 
         reminder = service.create_reminder(text="Delete me", due_at=due_at)
         service.delete_reminder(reminder.id)
@@ -149,11 +144,10 @@ class TestReminderService:
         with pytest.raises(ValidationError, match="not found"):
             service.get_reminder(reminder.id)
 
-    def test_get_overdue_reminders(self, test_session):
+    def test_get_overdue_reminders(self, test_session, service):
         """Test getting overdue reminders."""
         from remind_database.models import ReminderModel
 
-        service = ReminderService(test_session)
         now = datetime.now(timezone.utc)
 
         # Create overdue reminder directly (bypass service validation)
@@ -175,9 +169,54 @@ class TestReminderService:
         assert len(overdue) == 1
         assert overdue[0].text == "Overdue task"
 
-    def test_get_upcoming_reminders(self, test_session):
+    def test_get_overdue_reminders_excluding(self, test_session, service):
+        """Test excluded IDs are filtered out of overdue reminders."""
+        from remind_database.models import ReminderModel
+
+        now = datetime.now()
+
+        first = ReminderModel(text="First", due_at=now - timedelta(hours=2), priority="medium")
+        second = ReminderModel(text="Second", due_at=now - timedelta(hours=1), priority="medium")
+        test_session.add_all([first, second])
+        test_session.commit()
+
+        overdue = service.get_overdue_reminders(exclude_ids={first.id})
+        assert [r.text for r in overdue] == ["Second"]
+        assert service.get_overdue_reminders(exclude_ids={first.id, second.id}) == []
+
+    def test_scheduler_state_persists_notifications(self, test_session, service):
+        """Test notified reminders drop out until they are rescheduled."""
+        from remind_database.models import ReminderModel
+
+        now = datetime.now()
+
+        overdue = ReminderModel(text="Overdue", due_at=now - timedelta(hours=1), priority="medium")
+        test_session.add(overdue)
+        test_session.commit()
+
+        assert [r.text for r in service.get_unnotified_overdue_reminders()] == ["Overdue"]
+        service.mark_notified([overdue.id], now)
+        assert service.get_unnotified_overdue_reminders() == []
+
+        # Moving the due date resets the scheduler state
+        service.update_reminder(overdue.id, due_at=now - timedelta(minutes=1))
+        assert [r.text for r in service.get_unnotified_overdue_reminders()] == ["Overdue"]
+
+    def test_record_nudges(self, service):
+        """Test nudges are counted and recently nudged reminders are skipped."""
+        now = datetime.now()
+        reminder = service.create_reminder(text="Soon", due_at=now + timedelta(hours=1))
+
+        service.record_nudges([reminder.id], now)
+        service.record_nudges([reminder.id], now)
+
+        assert service.get_last_nudges() == [(now, 2)]
+        assert service.get_nudge_candidates(nudged_before=now - timedelta(minutes=30)) == []
+        [(found, last, count)] = service.get_nudge_candidates(nudged_before=now)
+        assert (found.id, last, count) == (reminder.id, now, 2)
+
+    def test_get_upcoming_reminders(self, service):
         """Test getting upcoming reminders."""
-        service = ReminderService(test_session)
         now = datetime.now(timezone.utc)
 
         # Create upcoming within 24 hours
@@ -195,3 +234,170 @@ class TestReminderService:
         upcoming = service.get_upcoming_reminders()
         assert len(upcoming) >= 1
         assert any("Due soon" in r.text for r in upcoming)
+
+    def test_list_reminders_with_status(self, test_session, service):
+        """Test overdue flag is computed alongside listed reminders."""
+        from remind_database.models import ReminderModel
+
+        now = datetime.now()
+
+        test_session.add(
+            ReminderModel(text="Overdue task", due_at=now - timedelta(hours=1), priority="medium")
+        )
+        test_session.commit()
+        service.create_reminder(text="Future task", due_at=now + timedelta(days=1))
+
+        rows = service.list_reminders_with_status()
+        assert [(r.text, overdue) for r, overdue in rows] == [
+            ("Overdue task", True),
+            ("Future task", False),
+        ]
+
+    def test_search_reminders_substring(self, service, fixed_now):
+        """Test search matches inside words and honours limit/offset."""
+        service.create_reminder(text="Buy groceries", due_at=fixed_now + timedelta(days=1))
+        service.create_reminder(text="Pick up GROCERIES", due_at=fixed_now + timedelta(days=2))
+        service.create_reminder(text="Call mom", due_at=fixed_now + timedelta(days=3))
+
+        assert [r.text for r in service.search_reminders("rocer")] == [
+            "Buy groceries",
+            "Pick up GROCERIES",
+        ]
+        assert [r.text for r in service.search_reminders("om")] == ["Call mom"]
+        assert [r.text for r in service.search_reminders("rocer", limit=1, offset=1)] == [
+            "Pick up GROCERIES",
+        ]
+
+    def test_search_reminders_prefix(self, service, seed):
+        """Test prefix search matches only at the start, case-insensitively."""
+        seed(texts=["Project kickoff", "project_review", "Review project", "Projection"])
+
+        assert sorted(r.text for r in service.search_reminders("proj", prefix=True)) == [
+            "Project kickoff",
+            "Projection",
+            "project_review",
+        ]
+        assert [r.text for r in service.search_reminders("project_", prefix=True)] == [
+            "project_review"
+        ]
+        # Without prefix a trailing * is just part of the substring
+        assert service.search_reminders("proj*") == []
+
+    def test_bulk_import_rebuilds_indexes(self, test_session, service, monkeypatch):
+        """Test bulk import inserts every row and leaves the existing indexes in place."""
+        from remind_database.repositories import reminder as repo_module
+        from sqlalchemy import inspect
+
+        conn = test_session.connection()
+        conn.exec_driver_sql("CREATE INDEX ix_reminders_due_at ON reminders (due_at)")
+        monkeypatch.setattr(repo_module, "_REINDEX_MIN_ROWS", 2)
+        due = datetime.now() + timedelta(days=1)
+
+        imported = repo_module.ReminderRepository(test_session).bulk_import(
+            [{"text": f"Imported {i}", "due_at": due} for i in range(3)]
+        )
+
+        assert imported == 3
+        assert len(service.list_active_reminders()) == 3
+        names = {ix["name"] for ix in inspect(test_session.connection()).get_indexes("reminders")}
+        assert "ix_reminders_due_at" in names
+        assert "ix_reminders_active_due" in names
+        assert "ix_reminders_done_at" not in names
+
+    def test_failed_bulk_import_keeps_indexes(self, test_session, service, monkeypatch):
+        """Test a bulk import that fails part-way leaves no rows and every index intact."""
+        from remind_database.repositories import reminder as repo_module
+        from sqlalchemy import inspect
+        from sqlalchemy.exc import IntegrityError
+
+        monkeypatch.setattr(repo_module, "_REINDEX_MIN_ROWS", 2)
+        due = datetime.now() + timedelta(days=1)
+        rows = [{"text": f"Imported {i}", "due_at": due} for i in range(2)]
+        rows.append({"text": None, "due_at": due})
+
+        with pytest.raises(IntegrityError):
+            repo_module.ReminderRepository(test_session).bulk_import(rows)
+
+        assert service.list_active_reminders() == []
+        names = {ix["name"] for ix in inspect(test_session.connection()).get_indexes("reminders")}
+        assert "ix_reminders_active_due" in names
+
+    def test_dashboard_snapshot_matches_summary(self, test_session, service):
+        """Test the single-query dashboard agrees with get_summary."""
+        from remind_database.models import ReminderModel
+        from remind_shared import PriorityLevel
+
+        now = datetime.now()
+
+        test_session.add(
+            ReminderModel(text="Overdue task", due_at=now - timedelta(hours=1), priority="high")
+        )
+        test_session.commit()
+        service.create_reminder(text="Soon", due_at=now + timedelta(minutes=5), project_context="work")
+        service.create_reminder(text="Later", due_at=now + timedelta(days=3), project_context="work")
+        service.create_reminder(text="Far", due_at=now + timedelta(days=30), priority=PriorityLevel.LOW)
+
+        snapshot = service.dashboard_snapshot()
+        summary = service.get_summary()
+
+        for key in (
+            "total_active",
+            "overdue_count",
+            "due_today_count",
+            "due_this_week_count",
+            "by_priority",
+            "by_project",
+        ):
+            assert snapshot[key] == summary[key], key
+        assert [r.text for r in snapshot["overdue"]] == ["Overdue task"]
+        assert [r.text for r in snapshot["upcoming"]] == ["Soon"]
+
+    def test_get_summary_counts(self, test_session, service):
+        """Test the summary separates overdue reminders from today's."""
+        from remind_database.models import ReminderModel
+
+        now = datetime.now()
+
+        test_session.add(
+            ReminderModel(text="Overdue task", due_at=now - timedelta(hours=1), priority="high")
+        )
+        test_session.commit()
+        service.create_reminder(text="Later", due_at=now + timedelta(days=3), project_context="work")
+        done = service.create_reminder(text="Done", due_at=now + timedelta(days=1))
+        service.mark_reminder_done(done.id)
+
+        summary = service.get_summary()
+
+        assert summary["total_active"] == 2
+        assert summary["overdue_count"] == 1
+        assert all(r.text != "Overdue task" for r in summary["due_today"])
+        assert summary["due_this_week_count"] == 2
+        assert summary["by_priority"] == {"high": 1, "medium": 1}
+        assert summary["by_project"] == {"work": 1}
+
+    def test_snooze_reminder_seconds(self, service):
+        """Test snoozing moves the due date the given seconds from now."""
+        from remind_shared import ValidationError
+
+        reminder = service.create_reminder(
+            text="Snooze me", due_at=datetime.now() + timedelta(minutes=1)
+        )
+
+        before = datetime.now()
+        snoozed = service.snooze_reminder_seconds(reminder.id, 7200)
+
+        assert before + timedelta(hours=2) <= snoozed.due_at <= datetime.now() + timedelta(hours=2)
+        with pytest.raises(ValidationError, match="not found"):
+            service.snooze_reminder_seconds(999, 60)
+
+    def test_list_reminders_page(self, service):
+        """Test paging returns a slice ordered by due date and the total count."""
+        base = datetime.now() + timedelta(hours=1)
+        for i in range(5):
+            service.create_reminder(text=f"Task {i}", due_at=base + timedelta(minutes=i))
+
+        page, total = service.list_reminders_page(limit=2, offset=1)
+
+        assert total == 5
+        assert [r.text for r, _ in page] == ["Task 1", "Task 2"]
+        assert service.list_reminders_page(offset=10) == ([], 0)
@@ -3,24 +3,36 @@
 Test script for Groq AI integration.
 Input a reminder text, get AI suggestion back.
 
+Requires the workspace packages to be installed (``uv sync``, or
+``pip install -e packages/shared -e packages/database -e apps/backend``).
+
 Usage:
     python infrastructure/scripts/test_ai.py
 """
 
 import asyncio
+import importlib.util
 import sys
-from pathlib import Path
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "apps/backend/src"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "packages/shared/src"))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "packages/database/src"))
+REQUIRED_PACKAGES = ("remind_backend", "remind_shared", "remind_database")
+
+
+def _ensure_installed() -> None:
+    """Exit with a hint if the workspace packages aren't importable."""
+    missing = [name for name in REQUIRED_PACKAGES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Error: missing packages: {', '.join(missing)}")
+        print("   Install the workspace first:")
+        print("   uv sync  (or pip install -e packages/shared -e packages/database -e apps/backend)")
+        sys.exit(1)
 
 
 async def main():
     """Test Groq AI with user input."""
-    from remind_backend.app.ai import suggest_reminder
-    from remind_backend.core.config import get_settings
+    from groq import AsyncGroq
+
+    from remind_backend.ai import suggest_reminder
+    from remind_backend.config import get_settings
 
     settings = get_settings()
 
@@ -38,46 +50,56 @@ async def main():
     print(f"API Key: {settings.groq_api_key[:20]}...")
     print()
 
-    # Get user input
-    print("Enter a reminder text (or 'quit' to exit):")
-    reminder_text = input("> ").strip()
-
-    if reminder_text.lower() == "quit":
-        print("Exiting...")
-        sys.exit(0)
-
-    if not reminder_text:
-        print("❌ Error: Please enter a reminder text")
-        sys.exit(1)
-
-    print()
-    print("Processing with Groq AI...")
-    print("-" * 70)
-
-    try:
-        response = await suggest_reminder(reminder_text)
-
-        print("✓ Response received!")
-        print()
-        print(f"Original:  {reminder_text}")
-        print(f"Suggested: {response['suggested_text']}")
-        print(f"Priority:  {response['priority'].value}")
-        print(f"Due Time:  {response['due_time_suggestion'] or '(not specified)'}")
-        print()
-        print(f"Tokens - Input: {response['input_tokens']}, Output: {response['output_tokens']}")
-        print(f"Cost: {response['cost_cents']}¢")
-        print()
-        print("=" * 70)
-        print("✓ AI test successful!")
-
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    # One client for the session, so prompts after the first skip the TLS handshake
+    async with AsyncGroq(api_key=settings.groq_api_key) as client:
+        while True:
+            # Get user input
+            print("Enter a reminder text (or 'quit' to exit):")
+            try:
+                reminder_text = input("> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print("\nExiting...")
+                return
+
+            if reminder_text.lower() == "quit":
+                print("Exiting...")
+                return
+
+            if not reminder_text:
+                print("❌ Error: Please enter a reminder text")
+                print()
+                continue
+
+            print()
+            print("Processing with Groq AI...")
+            print("-" * 70)
+
+            try:
+                response = await suggest_reminder(reminder_text, client=client)
+
+                print("✓ Response received!")
+                print()
+                print(f"Original:  {reminder_text}")
+                print(f"Suggested: {response['suggested_text']}")
+                print(f"Priority:  {response['priority'].value}")
+                print(f"Due Time:  {response['due_time_suggestion'] or '(not specified)'}")
+                print()
+                print(f"Tokens - Input: {response['input_tokens']}, Output: {response['output_tokens']}")
+                print(f"Cost: {response['cost_cents']}¢")
+                print()
+                print("=" * 70)
+                print("✓ AI test successful!")
+                print()
+
+            except Exception as e:
+                print(f"❌ Error: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                sys.exit(1)
 
 
 if __name__ == "__main__":
+    _ensure_installed()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
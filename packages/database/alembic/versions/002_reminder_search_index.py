@@ -0,0 +1,32 @@
+"""Add trigram full-text index for reminder search (SQLite only).
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from remind_database.models import create_search_index
+
+from alembic import op
+
+# revision identifiers
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    create_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute("DROP TRIGGER IF EXISTS reminders_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS reminders_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS reminders_fts_ai")
+    op.execute("DROP TABLE IF EXISTS reminders_fts")
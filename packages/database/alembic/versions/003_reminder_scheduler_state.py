@@ -0,0 +1,35 @@
+"""Add scheduler state table so notifications survive scheduler restarts.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "reminder_scheduler_state",
+        sa.Column("reminder_id", sa.Integer(), nullable=False),
+        sa.Column("notified_at", sa.DateTime(), nullable=True),
+        sa.Column("last_nudge_at", sa.DateTime(), nullable=True),
+        sa.Column("nudge_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["reminder_id"], ["reminders.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("reminder_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_table("reminder_scheduler_state")
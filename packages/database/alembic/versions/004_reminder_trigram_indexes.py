@@ -0,0 +1,41 @@
+"""Add pg_trgm GIN indexes for reminder substring search (PostgreSQL only).
+
+SQLite gets its trigram index from the FTS5 table in revision 002.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # ILIKE '%query%' in search() and get_by_project() can use these directly
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reminders_text_trgm "
+        "ON reminders USING gin (text gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reminders_project_context_trgm "
+        "ON reminders USING gin (project_context gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_reminders_project_context_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_reminders_text_trgm")
@@ -0,0 +1,38 @@
+"""Add lower() prefix-search indexes on reminder text and project (PostgreSQL only).
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # Serve lower(col) LIKE 'prefix%' (search with prefix=True) from a btree
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reminders_text_lower "
+        "ON reminders (lower(text) text_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_reminders_project_lower "
+        "ON reminders (lower(project_context) text_pattern_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_reminders_project_lower")
+    op.execute("DROP INDEX IF EXISTS ix_reminders_text_lower")
@@ -0,0 +1,46 @@
+"""Add partial indexes on active reminders for the priority/project counts.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # count_by_priority() / count_by_project() only look at reminders not yet done
+    # if_not_exists: DatabaseSession creates these from the model on startup
+    active = sa.text("done_at IS NULL")
+    op.create_index(
+        "ix_reminders_active_priority",
+        "reminders",
+        ["priority"],
+        postgresql_where=active,
+        sqlite_where=active,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_reminders_active_project",
+        "reminders",
+        ["project_context"],
+        postgresql_where=active,
+        sqlite_where=active,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_reminders_active_project", table_name="reminders")
+    op.drop_index("ix_reminders_active_priority", table_name="reminders")
@@ -0,0 +1,43 @@
+"""Replace the done_at index with a partial due_at index over active reminders.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Active listings filter done_at IS NULL and range/sort on due_at: one ordered index walk
+    # if_not_exists: DatabaseSession creates it from the model on startup
+    active = sa.text("done_at IS NULL")
+    op.create_index(
+        "ix_reminders_active_due",
+        "reminders",
+        ["due_at"],
+        postgresql_where=active,
+        sqlite_where=active,
+        if_not_exists=True,
+    )
+    # Nothing queries done reminders by done_at, so this only cost writes; databases
+    # created from the current model never had it
+    op.drop_index(op.f("ix_reminders_done_at"), table_name="reminders", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.create_index(
+        op.f("ix_reminders_done_at"), "reminders", ["done_at"], unique=False
+    )
+    op.drop_index("ix_reminders_active_due", table_name="reminders")
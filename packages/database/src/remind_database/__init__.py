@@ -1,13 +1,45 @@
-"""Database layer for Remind - models, repositories, migrations."""
+"""Database layer for Remind - models, repositories, migrations.
 
-from remind_database.models import Base, ReminderModel
-from remind_database.repositories.reminder import ReminderRepository
-from remind_database.session import DatabaseConfig, DatabaseSession
+Names are loaded on first access (PEP 562), so importing the package does
+not pull in SQLAlchemy until something actually uses the database.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from remind_database.models import Base, ReminderModel, ReminderSchedulerStateModel
+    from remind_database.repositories.reminder import ReminderRepository
+    from remind_database.session import DatabaseConfig, DatabaseSession
+
+_EXPORTS = {
+    "Base": "remind_database.models",
+    "ReminderModel": "remind_database.models",
+    "ReminderSchedulerStateModel": "remind_database.models",
+    "ReminderRepository": "remind_database.repositories.reminder",
+    "DatabaseConfig": "remind_database.session",
+    "DatabaseSession": "remind_database.session",
+}
 
 __all__ = [
     "Base",
     "ReminderModel",
+    "ReminderSchedulerStateModel",
     "ReminderRepository",
     "DatabaseConfig",
     "DatabaseSession",
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,23 @@
 """SQLAlchemy ORM models for Remind database."""
 
+import sqlite3
 from datetime import datetime, timezone
+from functools import cache
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, ForeignKey
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from remind_shared import PriorityLevel, Reminder
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base for the Remind ORM models."""
+
+
+def _utcnow() -> datetime:
+    """Default for timezone-aware timestamp columns."""
+    return datetime.now(timezone.utc)
 
 
 class UserModel(Base):
@@ -15,12 +25,12 @@ class UserModel(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    token = Column(String(255), nullable=False, unique=True, index=True)
-    email = Column(String(255), nullable=True, index=True)
-    plan_tier = Column(String(50), nullable=False, default="free")
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    token: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    email: Mapped[str | None] = mapped_column(String(255), index=True)
+    plan_tier: Mapped[str] = mapped_column(String(50), default="free")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
 
 
 class UsageLogModel(Base):
@@ -28,12 +38,14 @@ class UsageLogModel(Base):
 
     __tablename__ = "usage_logs"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    input_tokens = Column(Integer, nullable=False)
-    output_tokens = Column(Integer, nullable=False)
-    cost_cents = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    input_tokens: Mapped[int]
+    output_tokens: Mapped[int]
+    cost_cents: Mapped[int]
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, index=True
+    )
 
 
 class RateLimitModel(Base):
@@ -41,26 +53,55 @@ class RateLimitModel(Base):
 
     __tablename__ = "rate_limits"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True, index=True)
-    request_count = Column(Integer, nullable=False, default=0)
-    reset_at = Column(DateTime(timezone=True), nullable=False, index=True)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), unique=True, index=True)
+    request_count: Mapped[int] = mapped_column(default=0)
+    reset_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+
+
+# Stored priority string -> enum member, cheaper than PriorityLevel(value) per row
+_PRIORITY_CACHE = {p.value: p for p in PriorityLevel}
+
+
+# WHERE clause of the partial indexes over reminders not yet done
+_ACTIVE = text("done_at IS NULL")
 
 
 class ReminderModel(Base):
     """SQLAlchemy ORM model for reminders."""
 
     __tablename__ = "reminders"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    text = Column(String(1000), nullable=False)
-    due_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.now)
-    done_at = Column(DateTime, nullable=True)
-    priority = Column(String(20), nullable=False, default="medium")
-    project_context = Column(String(500), nullable=True)
-    ai_suggested_text = Column(Text, nullable=True)
+    # Partial indexes over active reminders, as in the alembic migrations
+    __table_args__ = (
+        Index(
+            "ix_reminders_active_due",
+            "due_at",
+            sqlite_where=_ACTIVE,
+            postgresql_where=_ACTIVE,
+        ),
+        Index(
+            "ix_reminders_active_priority",
+            "priority",
+            sqlite_where=_ACTIVE,
+            postgresql_where=_ACTIVE,
+        ),
+        Index(
+            "ix_reminders_active_project",
+            "project_context",
+            sqlite_where=_ACTIVE,
+            postgresql_where=_ACTIVE,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    text: Mapped[str] = mapped_column(String(1000))
+    due_at: Mapped[datetime]
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+    done_at: Mapped[datetime | None]
+    priority: Mapped[str] = mapped_column(String(20), default="medium")
+    project_context: Mapped[str | None] = mapped_column(String(500))
+    ai_suggested_text: Mapped[str | None] = mapped_column(Text)
 
     def to_pydantic(self) -> Reminder:
         """Convert ORM model to Pydantic model."""
@@ -70,7 +111,75 @@ class ReminderModel(Base):
             due_at=self.due_at,
             created_at=self.created_at,
             done_at=self.done_at,
-            priority=PriorityLevel(self.priority),
+            priority=_PRIORITY_CACHE[self.priority],
             project_context=self.project_context,
             ai_suggested_text=self.ai_suggested_text,
         )
+
+
+class ReminderSchedulerStateModel(Base):
+    """Scheduler bookkeeping for a reminder, kept across scheduler restarts.
+
+    Timestamps are naive UTC, the scheduler's own clock.
+    """
+
+    __tablename__ = "reminder_scheduler_state"
+
+    reminder_id: Mapped[int] = mapped_column(
+        ForeignKey("reminders.id", ondelete="CASCADE"), primary_key=True
+    )
+    notified_at: Mapped[datetime | None]
+    last_nudge_at: Mapped[datetime | None]
+    nudge_count: Mapped[int] = mapped_column(default=0)
+
+
+# Trigram FTS5 index over reminder text. Trigrams keep the case-insensitive
+# substring semantics of ILIKE '%q%' while letting SQLite use an index.
+# The content table is kept in sync by triggers.
+REMINDERS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS reminders_fts USING fts5("
+    "text, content='reminders', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS reminders_fts_ai AFTER INSERT ON reminders BEGIN "
+    "INSERT INTO reminders_fts(rowid, text) VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS reminders_fts_ad AFTER DELETE ON reminders BEGIN "
+    "INSERT INTO reminders_fts(reminders_fts, rowid, text) VALUES ('delete', old.id, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS reminders_fts_au AFTER UPDATE OF text ON reminders BEGIN "
+    "INSERT INTO reminders_fts(reminders_fts, rowid, text) VALUES ('delete', old.id, old.text); "
+    "INSERT INTO reminders_fts(rowid, text) VALUES (new.id, new.text); END",
+)
+
+
+@cache
+def sqlite_supports_trigram() -> bool:
+    """Check whether the linked SQLite has FTS5 with the trigram tokenizer."""
+    try:
+        with sqlite3.connect(":memory:") as conn:
+            conn.execute("CREATE VIRTUAL TABLE t USING fts5(x, tokenize='trigram')")
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def create_search_index(connection: Connection) -> bool:
+    """Create the reminders FTS index on SQLite, backfilling existing rows.
+
+    Returns:
+        True if the index exists after the call
+    """
+    if connection.dialect.name != "sqlite" or not sqlite_supports_trigram():
+        return False
+
+    existed = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'reminders_fts'"
+    ).first()
+    for statement in REMINDERS_FTS_DDL:
+        connection.exec_driver_sql(statement)
+    if not existed:
+        connection.exec_driver_sql("INSERT INTO reminders_fts(reminders_fts) VALUES ('rebuild')")
+    return True
+
+
+@event.listens_for(ReminderModel.__table__, "after_create")
+def _create_search_index_after_table(target, connection, **kw) -> None:
+    """Build the search index whenever the reminders table is created."""
+    create_search_index(connection)
@@ -1,11 +1,133 @@
 """Reminder repository for database access."""
 
-from datetime import datetime, timedelta, timezone
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 
+from sqlalchemy import Integer, bindparam, case, func, insert, select, text, update
 from sqlalchemy.orm import Session
 
 from remind_shared import PriorityLevel, Reminder
-from remind_database.models import ReminderModel
+from remind_database.models import (
+    _PRIORITY_CACHE,
+    ReminderModel,
+    ReminderSchedulerStateModel,
+    sqlite_supports_trigram,
+)
+
+# Rowids of reminders whose text contains :pattern, served by the trigram index
+_FTS_MATCH = text(
+    "SELECT rowid FROM reminders_fts WHERE reminders_fts MATCH :pattern"
+).columns(rowid=Integer)
+
+# Hot lookups are built once with bound parameters, so every call hits
+# SQLAlchemy's compiled-statement cache under the same key
+_NOT_DONE = ReminderModel.done_at.is_(None)
+# List queries select plain columns; _fetch builds Reminders from the tuples
+_ALL = select(
+    ReminderModel.id,
+    ReminderModel.text,
+    ReminderModel.due_at,
+    ReminderModel.created_at,
+    ReminderModel.done_at,
+    ReminderModel.priority,
+    ReminderModel.project_context,
+    ReminderModel.ai_suggested_text,
+).order_by(ReminderModel.due_at)
+_ACTIVE = _ALL.where(_NOT_DONE)
+_OVERDUE = _ACTIVE.where(ReminderModel.due_at < bindparam("now"))
+_DUE_BETWEEN = _ACTIVE.where(ReminderModel.due_at.between(bindparam("now"), bindparam("until")))
+_DUE_BY = _ACTIVE.where(ReminderModel.due_at <= bindparam("until"))
+_EXCLUDING = ReminderModel.id.not_in(bindparam("ids", expanding=True))
+_OVERDUE_EXCLUDING = _OVERDUE.where(_EXCLUDING)
+_DUE_BETWEEN_EXCLUDING = _DUE_BETWEEN.where(_EXCLUDING)
+_TEXT_LIKE = _ALL.where(ReminderModel.text.ilike(bindparam("pattern")))
+# PostgreSQL: same ILIKE match (served by the pg_trgm GIN index), best matches first
+_TEXT_LIKE_RANKED = _TEXT_LIKE.order_by(None).order_by(
+    func.similarity(ReminderModel.text, bindparam("query")).desc(), ReminderModel.due_at
+)
+_HAS_PG_TRGM = text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+_FTS_SEARCH = _ALL.where(ReminderModel.id.in_(_FTS_MATCH))
+_PROJECT_LIKE = _ALL.where(ReminderModel.project_context.ilike(bindparam("pattern")))
+_IDS = ReminderModel.id.in_(bindparam("ids", expanding=True))
+_MARK_DONE = update(ReminderModel).where(_IDS, _NOT_DONE).values(done_at=bindparam("now"))
+# Anchored prefix matches, written so PostgreSQL can use the lower(...) text_pattern_ops indexes
+_TEXT_PREFIX = _ALL.where(
+    func.lower(ReminderModel.text).like(func.lower(bindparam("pattern")), escape="\\")
+)
+_PROJECT_PREFIX = _ALL.where(
+    func.lower(ReminderModel.project_context).like(func.lower(bindparam("pattern")), escape="\\")
+)
+
+# Scheduler and dashboard queries: every time bound is a parameter, computed once per call
+_STATE = ReminderSchedulerStateModel
+_WITH_STATE = (_STATE, _STATE.reminder_id == ReminderModel.id)
+_OVERDUE_UNNOTIFIED = _OVERDUE.outerjoin(*_WITH_STATE).where(_STATE.notified_at.is_(None))
+_NUDGE_CANDIDATES = (
+    select(ReminderModel, _STATE.last_nudge_at, _STATE.nudge_count)
+    .outerjoin(*_WITH_STATE)
+    .where(ReminderModel.due_at.between(bindparam("now"), bindparam("until")), _NOT_DONE)
+    .where(_STATE.last_nudge_at.is_(None) | (_STATE.last_nudge_at <= bindparam("nudged_before")))
+    .order_by(ReminderModel.due_at)
+)
+_NEXT_DUE_AT = select(func.min(ReminderModel.due_at)).where(
+    ReminderModel.due_at > bindparam("now"), _NOT_DONE
+)
+_ACTIVE_WITH_WINDOWS = (
+    select(
+        ReminderModel,
+        case((ReminderModel.due_at < bindparam("now"), True), else_=False),
+        case(
+            (ReminderModel.due_at.between(bindparam("now"), bindparam("until")), True),
+            else_=False,
+        ),
+        case((ReminderModel.due_at <= bindparam("end_of_day"), True), else_=False),
+        case((ReminderModel.due_at <= bindparam("week_end"), True), else_=False),
+    )
+    .where(_NOT_DONE)
+    .order_by(ReminderModel.due_at)
+)
+
+# Grouped counts over active reminders, served by the partial indexes in revision 006
+_COUNT_BY_PRIORITY = (
+    select(ReminderModel.priority, func.count())
+    .where(_NOT_DONE)
+    .group_by(ReminderModel.priority)
+)
+_COUNT_BY_PROJECT = (
+    select(ReminderModel.project_context, func.count())
+    .where(_NOT_DONE, ReminderModel.project_context.is_not(None))
+    .group_by(ReminderModel.project_context)
+)
+
+
+# CREATE INDEX statements for the secondary (non-constraint) indexes on reminders,
+# read back from the catalog so whatever the migrations built is rebuilt as-is
+_INDEX_DDL = {
+    "sqlite": text(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'reminders' AND sql IS NOT NULL "
+        "AND sql NOT LIKE 'CREATE UNIQUE%'"
+    ),
+    "postgresql": text(
+        "SELECT c.relname, pg_get_indexdef(i.indexrelid) FROM pg_index i "
+        "JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE i.indrelid = 'reminders'::regclass AND NOT i.indisprimary AND NOT i.indisunique"
+    ),
+}
+# Below this, per-row index upkeep is cheaper than rebuilding the indexes
+_REINDEX_MIN_ROWS = 1000
+# Columns streamed by bulk_import_copy(), with defaults for ones a row leaves out
+_COPY_COLUMNS = ("text", "due_at", "created_at", "priority", "project_context", "ai_suggested_text")
+_COPY_SQL = f"COPY reminders ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+
+# Whether pg_trgm is installed, per database URL; checked once per process
+_pg_trgm_installed: dict[str, bool] = {}
+
+
+def _prefix_pattern(prefix: str) -> str:
+    """LIKE pattern matching values that start with `prefix`, wildcards escaped."""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
 
 
 class ReminderRepository:
@@ -24,58 +146,118 @@ class ReminderRepository:
         ai_suggested_text: str | None = None,
     ) -> Reminder:
         """Create a new reminder."""
-        reminder = ReminderModel(
-            text=text,
-            due_at=due_at,
-            priority=priority.value,
-            project_context=project_context,
-            ai_suggested_text=ai_suggested_text,
-        )
-        self.session.add(reminder)
+        values = {
+            "text": text,
+            "due_at": due_at,
+            "priority": priority.value,
+            "project_context": project_context,
+            "ai_suggested_text": ai_suggested_text,
+        }
+        if self.session.get_bind().dialect.insert_returning:
+            # The INSERT hands back the stored row, id and created_at included
+            reminder = self.session.scalars(
+                insert(ReminderModel).values(values).returning(ReminderModel)
+            ).one()
+        else:
+            reminder = ReminderModel(**values)
+            self.session.add(reminder)
         self.session.commit()
-        self.session.refresh(reminder)
         return reminder.to_pydantic()
 
+    def _fetch(self, stmt, **params) -> list[Reminder]:
+        """Run a reminder column select and build Reminders from the rows.
+
+        The values come straight from typed columns, so Pydantic validation
+        and ORM instances are skipped.
+        """
+        construct = Reminder.model_construct
+        priorities = _PRIORITY_CACHE
+        return [
+            construct(
+                id=id_,
+                text=text_,
+                due_at=due_at,
+                created_at=created_at,
+                done_at=done_at,
+                priority=priorities[priority],
+                project_context=project_context,
+                ai_suggested_text=ai_suggested_text,
+            )
+            for (
+                id_,
+                text_,
+                due_at,
+                created_at,
+                done_at,
+                priority,
+                project_context,
+                ai_suggested_text,
+            ) in self.session.execute(stmt, params)
+        ]
+
     def get_by_id(self, reminder_id: int) -> Reminder | None:
         """Get a reminder by ID."""
-        reminder = self.session.query(ReminderModel).filter_by(id=reminder_id).first()
+        reminder = self.session.get(ReminderModel, reminder_id)
         return reminder.to_pydantic() if reminder else None
 
     def list_active(self) -> list[Reminder]:
         """List all active (not done) reminders."""
-        reminders = (
-            self.session.query(ReminderModel)
-            .filter(ReminderModel.done_at.is_(None))
-            .order_by(ReminderModel.due_at)
-            .all()
-        )
-        return [r.to_pydantic() for r in reminders]
+        return self._fetch(_ACTIVE)
 
     def list_all(self) -> list[Reminder]:
         """List all reminders including done ones."""
-        reminders = self.session.query(ReminderModel).order_by(ReminderModel.due_at).all()
-        return [r.to_pydantic() for r in reminders]
+        return self._fetch(_ALL)
 
     def mark_done(self, reminder_id: int) -> Reminder | None:
         """Mark a reminder as done."""
-        reminder = self.session.query(ReminderModel).filter_by(id=reminder_id).first()
+        reminder = self.session.get(ReminderModel, reminder_id)
         if reminder:
             reminder.done_at = datetime.now()
             self.session.commit()
-            self.session.refresh(reminder)
             return reminder.to_pydantic()
         return None
 
-    def search(self, query: str) -> list[Reminder]:
-        """Search reminders by text."""
-        search_pattern = f"%{query}%"
-        reminders = (
-            self.session.query(ReminderModel)
-            .filter(ReminderModel.text.ilike(search_pattern))
-            .order_by(ReminderModel.due_at)
-            .all()
+    def search(
+        self, query: str, limit: int | None = None, offset: int = 0, prefix: bool = False
+    ) -> list[Reminder]:
+        """Search reminders by text (case-insensitive substring match).
+
+        With `prefix`, only texts starting with the query match. On PostgreSQL
+        with pg_trgm, substring matches come back most similar first;
+        elsewhere results are ordered by due date.
+        """
+        params: dict[str, str] = {}
+        if prefix:
+            stmt, pattern = _TEXT_PREFIX, _prefix_pattern(query)
+        elif self._use_fts(query):
+            # Quote as an FTS5 string so the query is matched literally
+            stmt, pattern = _FTS_SEARCH, '"' + query.replace('"', '""') + '"'
+        elif self._use_similarity():
+            stmt, pattern = _TEXT_LIKE_RANKED, f"%{query}%"
+            params["query"] = query
+        else:
+            stmt, pattern = _TEXT_LIKE, f"%{query}%"
+        if limit is not None or offset:
+            stmt = stmt.offset(offset).limit(limit)
+        return self._fetch(stmt, pattern=pattern, **params)
+
+    def _use_similarity(self) -> bool:
+        """Similarity ranking needs PostgreSQL with the pg_trgm extension (revision 004)."""
+        bind = self.session.get_bind()
+        if bind.dialect.name != "postgresql":
+            return False
+        key = str(bind.url)
+        if key not in _pg_trgm_installed:
+            _pg_trgm_installed[key] = self.session.execute(_HAS_PG_TRGM).first() is not None
+        return _pg_trgm_installed[key]
+
+    def _use_fts(self, query: str) -> bool:
+        """Trigram matching needs SQLite with FTS5 and at least three characters."""
+        return (
+            len(query) >= 3
+            and self.session.get_bind().dialect.name == "sqlite"
+            and sqlite_supports_trigram()
         )
-        return [r.to_pydantic() for r in reminders]
 
     def update(
         self,
@@ -86,127 +268,314 @@ class ReminderRepository:
         project_context: str | None = None,
     ) -> Reminder | None:
         """Update a reminder's fields. Only non-None fields are changed."""
-        reminder = self.session.query(ReminderModel).filter_by(id=reminder_id).first()
+        reminder = self.session.get(ReminderModel, reminder_id)
         if not reminder:
             return None
         if text is not None:
             reminder.text = text
         if due_at is not None:
             reminder.due_at = due_at
+            # A rescheduled reminder should be notified (and nudged) afresh
+            self._clear_scheduler_state([reminder_id])
         if priority is not None:
             reminder.priority = priority.value
         if project_context is not None:
             reminder.project_context = project_context
         self.session.commit()
-        self.session.refresh(reminder)
         return reminder.to_pydantic()
 
     def delete(self, reminder_id: int) -> bool:
         """Delete a reminder permanently."""
-        reminder = self.session.query(ReminderModel).filter_by(id=reminder_id).first()
+        reminder = self.session.get(ReminderModel, reminder_id)
         if reminder:
+            # SQLite may reuse the id, so don't leave scheduler state behind for it
+            self._clear_scheduler_state([reminder_id])
             self.session.delete(reminder)
             self.session.commit()
             return True
         return False
 
-    def get_overdue(self) -> list[Reminder]:
+    def get_overdue(self, now: datetime | None = None) -> list[Reminder]:
         """Get all overdue reminders (due_at < now and not done)."""
-        now = datetime.now()
-        reminders = (
-            self.session.query(ReminderModel)
-            .filter(ReminderModel.due_at < now)
-            .filter(ReminderModel.done_at.is_(None))
-            .order_by(ReminderModel.due_at)
-            .all()
-        )
-        return [r.to_pydantic() for r in reminders]
+        return self._fetch(_OVERDUE, now=now or datetime.now())
+
+    def get_overdue_excluding(
+        self, ids: Iterable[int], now: datetime | None = None
+    ) -> list[Reminder]:
+        """Get overdue reminders, skipping the given IDs in SQL."""
+        return self._fetch(_OVERDUE_EXCLUDING, now=now or datetime.now(), ids=list(ids))
 
-    def get_upcoming(self, hours: int = 24) -> list[Reminder]:
+    def get_upcoming(self, hours: int = 24, now: datetime | None = None) -> list[Reminder]:
         """Get reminders due within the next N hours."""
+        now = now or datetime.now()
+        return self._fetch(_DUE_BETWEEN, now=now, until=now + timedelta(hours=hours))
+
+    def get_upcoming_excluding(
+        self, ids: Iterable[int], hours: int = 24, now: datetime | None = None
+    ) -> list[Reminder]:
+        """Get reminders due within the next N hours, skipping the given IDs in SQL."""
+        now = now or datetime.now()
+        return self._fetch(
+            _DUE_BETWEEN_EXCLUDING, now=now, until=now + timedelta(hours=hours), ids=list(ids)
+        )
+
+    def get_overdue_unnotified(self) -> list[Reminder]:
+        """Get overdue reminders the scheduler hasn't notified yet."""
+        return self._fetch(_OVERDUE_UNNOTIFIED, now=datetime.now())
+
+    def get_nudge_candidates(
+        self, nudged_before: datetime, hours: int = 24
+    ) -> list[tuple[Reminder, datetime | None, int]]:
+        """Get reminders due within the next N hours that may be due a nudge.
+
+        Reminders last nudged after `nudged_before` are left out in SQL.
+
+        Returns:
+            Tuples of (reminder, last nudge time or None, nudges sent so far)
+        """
         now = datetime.now()
-        future = now + timedelta(hours=hours)
-        reminders = (
-            self.session.query(ReminderModel)
-            .filter(ReminderModel.due_at >= now)
-            .filter(ReminderModel.due_at <= future)
+        rows = self.session.execute(
+            _NUDGE_CANDIDATES,
+            {"now": now, "until": now + timedelta(hours=hours), "nudged_before": nudged_before},
+        )
+        return [(r.to_pydantic(), last, count or 0) for r, last, count in rows]
+
+    def last_nudges(self) -> list[tuple[datetime, int]]:
+        """Get (last nudge time, nudges sent) for active reminders that were nudged."""
+        state = ReminderSchedulerStateModel
+        rows = (
+            self.session.query(state.last_nudge_at, state.nudge_count)
+            .join(ReminderModel, state.reminder_id == ReminderModel.id)
             .filter(ReminderModel.done_at.is_(None))
-            .order_by(ReminderModel.due_at)
+            .filter(state.last_nudge_at.isnot(None))
             .all()
         )
-        return [r.to_pydantic() for r in reminders]
+        return [(last, count) for last, count in rows]
+
+    def mark_notified(self, reminder_ids: list[int], at: datetime) -> None:
+        """Record that the scheduler notified these reminders."""
+        for st in self._scheduler_states(reminder_ids):
+            st.notified_at = at
+        self.session.commit()
+
+    def record_nudges(self, reminder_ids: list[int], at: datetime) -> None:
+        """Record a nudge sent for each of these reminders."""
+        for st in self._scheduler_states(reminder_ids):
+            st.last_nudge_at = at
+            st.nudge_count = (st.nudge_count or 0) + 1
+        self.session.commit()
+
+    def _scheduler_states(self, reminder_ids: list[int]) -> list[ReminderSchedulerStateModel]:
+        """Load the scheduler state rows for these reminders, adding missing ones."""
+        if not reminder_ids:
+            return []
+        state = ReminderSchedulerStateModel
+        existing = {
+            st.reminder_id: st
+            for st in self.session.query(state).filter(state.reminder_id.in_(reminder_ids))
+        }
+        for reminder_id in reminder_ids:
+            if reminder_id not in existing:
+                existing[reminder_id] = state(reminder_id=reminder_id, nudge_count=0)
+                self.session.add(existing[reminder_id])
+        return list(existing.values())
+
+    def _clear_scheduler_state(self, reminder_ids: list[int]) -> None:
+        """Drop scheduler state for these reminders (committed by the caller)."""
+        state = ReminderSchedulerStateModel
+        self.session.query(state).filter(state.reminder_id.in_(reminder_ids)).delete(
+            synchronize_session=False
+        )
 
-    def get_by_project(self, project_context: str, include_done: bool = False) -> list[Reminder]:
-        """Get reminders filtered by project context."""
-        query = self.session.query(ReminderModel).filter(
-            ReminderModel.project_context.ilike(f"%{project_context}%")
+    def next_due_at(self) -> datetime | None:
+        """Get the earliest due time of active reminders not yet due."""
+        return self.session.execute(_NEXT_DUE_AT, {"now": datetime.now()}).scalar()
+
+    def _status_query(self, include_done: bool, project_context: str | None, *extra):
+        """Build the reminder query shared by the status listings."""
+        is_overdue = case(
+            (ReminderModel.done_at.is_(None) & (ReminderModel.due_at < datetime.now()), True),
+            else_=False,
         )
+        query = self.session.query(ReminderModel, is_overdue, *extra)
+        if project_context is not None:
+            query = query.filter(ReminderModel.project_context.ilike(f"%{project_context}%"))
         if not include_done:
             query = query.filter(ReminderModel.done_at.is_(None))
-        reminders = query.order_by(ReminderModel.due_at).all()
-        return [r.to_pydantic() for r in reminders]
+        return query.order_by(ReminderModel.due_at)
+
+    def list_with_status(
+        self, include_done: bool = False, project_context: str | None = None
+    ) -> list[tuple[Reminder, bool]]:
+        """List reminders paired with an overdue flag computed in SQL."""
+        rows = self._status_query(include_done, project_context).all()
+        return [(r.to_pydantic(), bool(overdue)) for r, overdue in rows]
+
+    def page_with_status(
+        self, include_done: bool = False, limit: int = 100, offset: int = 0
+    ) -> tuple[list[tuple[Reminder, bool]], int]:
+        """Fetch one page of reminders with overdue flags.
+
+        Returns:
+            The page and the total number of matching reminders, counted
+            with a window function in the same query
+        """
+        rows = (
+            self._status_query(include_done, None, func.count().over())
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+        total = rows[0][2] if rows else 0
+        return [(r.to_pydantic(), bool(overdue)) for r, overdue, _ in rows], total
+
+    def list_active_with_windows(
+        self, hours: int = 24
+    ) -> list[tuple[Reminder, bool, bool, bool, bool]]:
+        """List active reminders with time-window flags computed in one query.
+
+        Returns:
+            Tuples of (reminder, overdue, upcoming within `hours`,
+            due by end of today, due within 7 days)
+        """
+        now = datetime.now()
+        rows = self.session.execute(
+            _ACTIVE_WITH_WINDOWS,
+            {
+                "now": now,
+                "until": now + timedelta(hours=hours),
+                "end_of_day": now.replace(hour=23, minute=59, second=59),
+                "week_end": now + timedelta(days=7),
+            },
+        )
+        return [
+            (r.to_pydantic(), bool(overdue), bool(upcoming), bool(today), bool(week))
+            for r, overdue, upcoming, today, week in rows
+        ]
+
+    def get_by_project(
+        self, project_context: str, include_done: bool = False, prefix: bool = False
+    ) -> list[Reminder]:
+        """Get reminders filtered by project context (substring, or prefix with `prefix`)."""
+        if prefix:
+            stmt, pattern = _PROJECT_PREFIX, _prefix_pattern(project_context)
+        else:
+            stmt, pattern = _PROJECT_LIKE, f"%{project_context}%"
+        if not include_done:
+            stmt = stmt.where(_NOT_DONE)
+        return self._fetch(stmt, pattern=pattern)
 
     def bulk_mark_done(self, reminder_ids: list[int]) -> list[Reminder]:
         """Mark multiple reminders as done. Returns the ones that were completed."""
+        if not reminder_ids:
+            return []
+        # Local naive time like every other timestamp here; func.now() would be UTC on SQLite
+        params = {"ids": list(reminder_ids), "now": datetime.now()}
+        if self.session.get_bind().dialect.update_returning:
+            # One UPDATE ... RETURNING both completes and loads the rows
+            reminders = self.session.scalars(
+                _MARK_DONE.returning(ReminderModel),
+                params,
+                execution_options={"populate_existing": True},
+            ).all()
+            self.session.commit()
+            return [r.to_pydantic() for r in reminders]
+
+        # SQLite before 3.35: find the open ones, update them, then load them once
+        ids = self.session.scalars(select(ReminderModel.id).where(_IDS, _NOT_DONE), params).all()
+        if not ids:
+            return []
+        params["ids"] = list(ids)
+        self.session.execute(_MARK_DONE, params, execution_options={"synchronize_session": False})
+        self.session.commit()
+        return self._fetch(_ALL.where(_IDS), ids=params["ids"])
+
+    def bulk_import(self, reminders: list[dict]) -> int:
+        """Insert many reminders (column -> value dicts) in one transaction.
+
+        Large batches drop the secondary indexes first and rebuild them once
+        afterwards, instead of updating them row by row.
+
+        Returns:
+            Number of reminders inserted
+        """
+        if not reminders:
+            return 0
+        with self._indexes_dropped(len(reminders)):
+            self.session.execute(insert(ReminderModel), reminders)
+        self.session.commit()
+        return len(reminders)
+
+    def bulk_import_copy(self, reminders: list[dict]) -> int:
+        """Like bulk_import(), but stream the rows with COPY on PostgreSQL.
+
+        COPY skips the per-statement INSERT work entirely, which is what
+        matters for imports of thousands of reminders. Other databases use
+        bulk_import().
+
+        Returns:
+            Number of reminders inserted
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return self.bulk_import(reminders)
+        if not reminders:
+            return 0
         now = datetime.now()
-        reminders = (
-            self.session.query(ReminderModel)
-            .filter(ReminderModel.id.in_(reminder_ids))
-            .filter(ReminderModel.done_at.is_(None))
-            .all()
-        )
-        for r in reminders:
-            r.done_at = now
+        defaults = {"created_at": now, "priority": PriorityLevel.MEDIUM.value}
+        driver_conn = self.session.connection().connection.driver_connection
+        with (
+            self._indexes_dropped(len(reminders)),
+            driver_conn.cursor() as cursor,
+            cursor.copy(_COPY_SQL) as copy,
+        ):
+            for row in reminders:
+                copy.write_row(tuple(row.get(col, defaults.get(col)) for col in _COPY_COLUMNS))
         self.session.commit()
-        for r in reminders:
-            self.session.refresh(r)
-        return [r.to_pydantic() for r in reminders]
+        return len(reminders)
+
+    @contextmanager
+    def _indexes_dropped(self, row_count: int) -> Generator[None, None, None]:
+        """Drop secondary indexes around a large insert and rebuild each once after it.
+
+        The drops run inside the session's transaction, and a failed insert
+        rolls it back here, so the indexes are never left missing.
+        """
+        conn = self.session.connection()
+        ddl_query = _INDEX_DDL.get(conn.dialect.name)
+        indexes: dict[str, str] = {}
+        if row_count >= _REINDEX_MIN_ROWS and ddl_query is not None:
+            indexes = dict(conn.execute(ddl_query).all())
+        # pysqlite only opens a transaction before DML, so the DROPs would autocommit
+        if (
+            indexes
+            and conn.dialect.name == "sqlite"
+            and not conn.connection.driver_connection.in_transaction
+        ):
+            conn.exec_driver_sql("BEGIN")
+        quote = conn.dialect.identifier_preparer.quote
+        for name in indexes:
+            conn.exec_driver_sql(f"DROP INDEX {quote(name)}")
+        try:
+            yield
+        except BaseException:
+            self.session.rollback()
+            raise
+        for ddl in indexes.values():
+            conn.exec_driver_sql(ddl)
 
     def get_due_today(self) -> list[Reminder]:
         """Get reminders due today (not done)."""
-        now = datetime.now()
-        end_of_day = now.replace(hour=23, minute=59, second=59)
-        reminders = (
-            self.session.query(ReminderModel)
-            .filter(ReminderModel.due_at <= end_of_day)
-            .filter(ReminderModel.done_at.is_(None))
-            .order_by(ReminderModel.due_at)
-            .all()
-        )
-        return [r.to_pydantic() for r in reminders]
+        end_of_day = datetime.now().replace(hour=23, minute=59, second=59)
+        return self._fetch(_DUE_BY, until=end_of_day)
 
     def get_due_this_week(self) -> list[Reminder]:
         """Get reminders due within the next 7 days (not done)."""
-        now = datetime.now()
-        end_of_week = now + timedelta(days=7)
-        reminders = (
-            self.session.query(ReminderModel)
-            .filter(ReminderModel.due_at <= end_of_week)
-            .filter(ReminderModel.done_at.is_(None))
-            .order_by(ReminderModel.due_at)
-            .all()
-        )
-        return [r.to_pydantic() for r in reminders]
+        return self._fetch(_DUE_BY, until=datetime.now() + timedelta(days=7))
 
     def count_by_priority(self) -> dict[str, int]:
         """Count active reminders grouped by priority."""
-        from sqlalchemy import func
-        results = (
-            self.session.query(ReminderModel.priority, func.count())
-            .filter(ReminderModel.done_at.is_(None))
-            .group_by(ReminderModel.priority)
-            .all()
-        )
-        return {priority: count for priority, count in results}
+        return dict(self.session.execute(_COUNT_BY_PRIORITY).all())
 
     def count_by_project(self) -> dict[str, int]:
         """Count active reminders grouped by project context."""
-        from sqlalchemy import func
-        results = (
-            self.session.query(ReminderModel.project_context, func.count())
-            .filter(ReminderModel.done_at.is_(None))
-            .filter(ReminderModel.project_context.isnot(None))
-            .group_by(ReminderModel.project_context)
-            .all()
-        )
-        return {project: count for project, count in results}
+        return dict(self.session.execute(_COUNT_BY_PROJECT).all())
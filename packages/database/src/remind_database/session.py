@@ -3,13 +3,35 @@
 import os
 from collections.abc import Generator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool, QueuePool, StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 
-from remind_database.models import Base
+from remind_database.models import Base, ReminderModel, create_search_index
+
+# Session factory that get_session() uses instead of the engine's, see DatabaseSession.bind
+_bound_factory: ContextVar[sessionmaker | None] = ContextVar("remind_bound_factory", default=None)
+
+# Applied once to each new pooled SQLite connection; cache_size is in KiB when negative
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _tune_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Run the SQLite tuning pragmas on a freshly opened connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 class DatabaseConfig:
@@ -62,14 +84,19 @@ class DatabaseSession:
 
         # Configure engine based on database type
         if config.is_postgres():
-            # PostgreSQL production configuration
+            # PostgreSQL production configuration. No pre-ping round trip per
+            # checkout: LIFO lets idle extras age out, recycling stays under
+            # typical server idle timeouts, and a dropped connection is
+            # invalidated (with the rest of the pool) on its first error.
             DatabaseSession._engine = create_engine(
                 config.url,
                 poolclass=QueuePool,
-                pool_size=20,
-                max_overflow=40,
-                pool_pre_ping=True,
-                pool_recycle=3600,
+                pool_size=10,
+                max_overflow=20,
+                pool_pre_ping=False,
+                pool_recycle=1800,
+                pool_use_lifo=True,
+                pool_reset_on_return="rollback",
                 echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
             )
         elif config.is_sqlite():
@@ -86,32 +113,64 @@ class DatabaseSession:
             else:
                 # Ensure directory exists
                 Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                # Pooled, so the scheduler and server keep connections (and
+                # their page cache) warm instead of reopening the file per session
                 DatabaseSession._engine = create_engine(
                     config.url,
-                    connect_args={"check_same_thread": False},
-                    poolclass=NullPool,
+                    connect_args={"check_same_thread": False, "timeout": 30},
+                    poolclass=QueuePool,
+                    pool_size=5,
+                    max_overflow=10,
+                    pool_pre_ping=False,
                 )
+                event.listen(DatabaseSession._engine, "connect", _tune_sqlite_connection)
 
         DatabaseSession._session_factory = sessionmaker(
             bind=DatabaseSession._engine,
             expire_on_commit=False,
         )
 
-        # Create tables
+        # Create tables (and the search and partial indexes for databases that predate them)
         Base.metadata.create_all(DatabaseSession._engine)
+        with DatabaseSession._engine.begin() as connection:
+            create_search_index(connection)
+            for index in ReminderModel.__table__.indexes:
+                index.create(connection, checkfirst=True)
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Context manager for database sessions."""
-        if DatabaseSession._session_factory is None:
+        factory = _bound_factory.get() or DatabaseSession._session_factory
+        if factory is None:
             raise RuntimeError("DatabaseSession not initialized. Call DatabaseSession(config) first.")
 
-        session = DatabaseSession._session_factory()
+        session = factory()
         try:
             yield session
         finally:
             session.close()
 
+    @staticmethod
+    @contextmanager
+    def bind(connection: Connection) -> Generator[None, None, None]:
+        """Serve get_session() from an existing connection within this context.
+
+        Sessions join the connection's transaction through savepoints, so a
+        caller holding an outer transaction (e.g. a test) can roll back
+        everything they committed.
+        """
+        token = _bound_factory.set(
+            sessionmaker(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+        )
+        try:
+            yield
+        finally:
+            _bound_factory.reset(token)
+
     def close(self) -> None:
         """Close the database connection."""
         if DatabaseSession._engine:
@@ -1,5 +1,8 @@
 """Shared models and utilities for Remind."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from remind_shared.exceptions import (
     AIError,
     AuthenticationError,
@@ -9,13 +12,20 @@ from remind_shared.exceptions import (
     RemindException,
     ValidationError,
 )
-from remind_shared.models import (
-    AIResponse,
-    Config,
-    License,
-    PriorityLevel,
-    Reminder,
-    ReminderBase,
+
+if TYPE_CHECKING:
+    from remind_shared.models import (
+        AIResponse,
+        Config,
+        License,
+        PriorityLevel,
+        Reminder,
+        ReminderBase,
+    )
+
+# Models load on first access (PEP 562) so importing the exceptions doesn't pull in Pydantic
+_MODELS = frozenset(
+    {"AIResponse", "Config", "License", "PriorityLevel", "Reminder", "ReminderBase"}
 )
 
 __all__ = [
@@ -33,3 +43,16 @@ __all__ = [
     "DatabaseError",
     "AIError",
 ]
+
+
+def __getattr__(name: str):
+    """Import a model from remind_shared.models on first access."""
+    if name not in _MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module("remind_shared.models"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -65,3 +66,4 @@ class Config(BaseModel):
     ai_backend_url: str | None = None  # Backend API URL for AI suggestions
     openai_api_key: str | None = None  # OpenAI API key (for local usage)
     nudge_intervals_minutes: list[int] = Field(default_factory=lambda: [5, 15, 60])
+    summary_style: Literal["ascii", "emoji"] = "emoji"  # MCP get_summary markers